@@ -0,0 +1,71 @@
+"""
+Chronos v2 - Setup Cache
+Remembers the last Supabase connection that passed the setup wizard's test,
+so re-running the wizard can prefill it and skip a fresh test.
+The URL and validation time live in QSettings; the anon key in the system keyring.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from PyQt6.QtCore import QSettings
+
+logger = logging.getLogger(__name__)
+
+VALIDATION_TTL = timedelta(hours=24)
+
+SERVICE_NAME = "ChronosApp"
+KEY_USERNAME = "wizard_supabase_key"
+
+
+def _settings() -> QSettings:
+    return QSettings("chronos", "wizard")
+
+
+def get_last_connection() -> Optional[Tuple[str, str]]:
+    """Last validated (url, anon_key), or None if missing or unreadable"""
+    url = _settings().value("supabase_url", "", type=str)
+    if not url:
+        return None
+    try:
+        import keyring
+        key = keyring.get_password(SERVICE_NAME, KEY_USERNAME)
+    except Exception:
+        return None
+    return (url, key) if key else None
+
+
+def get_validated(url: str) -> Optional[datetime]:
+    """When `url` last passed the connection test (None if never or for another URL)"""
+    settings = _settings()
+    if settings.value("supabase_url", "", type=str) != url:
+        return None
+    try:
+        return datetime.fromisoformat(settings.value("validated_at", "", type=str))
+    except ValueError:
+        return None
+
+
+def is_fresh(url: str) -> bool:
+    """True if `url` passed the connection test within VALIDATION_TTL"""
+    validated_at = get_validated(url)
+    return validated_at is not None and datetime.now(timezone.utc) - validated_at < VALIDATION_TTL
+
+
+def save_validated(url: str, key: str) -> None:
+    """Record a successful connection test"""
+    try:
+        import keyring
+        keyring.set_password(SERVICE_NAME, KEY_USERNAME, key)
+    except Exception as e:
+        logger.warning("Could not cache Supabase key: %s", e)
+        return
+    settings = _settings()
+    settings.setValue("supabase_url", url)
+    settings.setValue("validated_at", datetime.now(timezone.utc).isoformat())
+
+
+def clear_validated() -> None:
+    """Forget the validation time (the prefilled values stay until replaced)"""
+    _settings().remove("validated_at")
@@ -33,11 +33,6 @@ class AppConfig:
     def get_config_path(cls) -> Path:
         """Get the configuration file path"""
         return cls.get_config_dir() / 'config.json'
-    
-    @classmethod
-    def get_session_path(cls) -> Path:
-        """Get the session file path"""
-        return cls.get_config_dir() / '.session'
 
 
 class ConfigManager:
@@ -0,0 +1,42 @@
+"""
+Chronos v2 - Shared HTTP Clients
+Process-wide httpx and Supabase clients, created on first use and reused
+so repeated requests keep their TCP/TLS connections alive.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Type-only: httpx and supabase are imported on first use
+    import httpx
+    from supabase import Client
+
+
+@lru_cache(maxsize=None)
+def http2_available() -> bool:
+    """True if the optional h2 package is installed (httpx needs it for HTTP/2)"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def get_http_client() -> 'httpx.Client':
+    """Shared httpx client with keep-alive connection pooling"""
+    import httpx
+    # httpx already negotiates gzip/deflate
+    return httpx.Client(
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=8),
+        http2=http2_available()
+    )
+
+
+@lru_cache(maxsize=4)
+def get_supabase(url: str, key: str) -> 'Client':
+    """Shared Supabase client for a (url, key) pair"""
+    from supabase import create_client
+    return create_client(url, key)
@@ -3,33 +3,36 @@ Chronos v2 - Authentication Service
 Manages user authentication with Supabase Auth.
 """
 
-from supabase import create_client, Client
-from typing import Optional, Tuple, Dict, List
+from typing import TYPE_CHECKING, Optional, Tuple, Dict, List
 
 from app.config import config
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 
 class AuthService:
     """Authentication service using Supabase Auth"""
     
     def __init__(self):
-        self._supabase: Optional[Client] = None
+        self._supabase: Optional['Client'] = None
         self._current_user: Optional[Dict] = None
         self._user_info: Optional[Dict] = None
     
-    def _get_client(self) -> Client:
+    def _get_client(self) -> 'Client':
         """Get or create Supabase client"""
         if not config.is_configured():
             raise Exception("Application not configured. Please run setup wizard.")
         
         if self._supabase is None:
+            from supabase import create_client
             self._supabase = create_client(
                 config.supabase_url,
                 config.supabase_anon_key
             )
         return self._supabase
     
-    def login(self, email: str, password: str) -> Tuple[Client, Dict]:
+    def login(self, email: str, password: str) -> Tuple['Client', Dict]:
         """
         Authenticate user with email and password.
         
@@ -73,7 +76,7 @@ class AuthService:
             else:
                 raise Exception(f"Login error: {error_msg}")
     
-    def _is_user_authorized(self, supabase: Client, user_id: str) -> bool:
+    def _is_user_authorized(self, supabase: 'Client', user_id: str) -> bool:
         """Check if user is in user_profiles table"""
         try:
             response = supabase.table("user_profiles")\
@@ -85,7 +88,7 @@ class AuthService:
             print(f"Error checking authorization: {e}")
             return False
     
-    def get_user_info(self, supabase: Client, user_id: str) -> Dict:
+    def get_user_info(self, supabase: 'Client', user_id: str) -> Dict:
         """Get user info including role and permissions"""
         try:
             # Get user profile with role
@@ -144,13 +147,13 @@ class AuthService:
             return []
         return self._user_info.get("permissions", [])
     
-    def get_client(self) -> Client:
+    def get_client(self) -> 'Client':
         """Get authenticated Supabase client"""
         if not self._supabase:
             raise Exception("Not authenticated. Please login first.")
         return self._supabase
     
-    def set_client(self, client: Client) -> None:
+    def set_client(self, client: 'Client') -> None:
         """Set Supabase client (for session restore)"""
         self._supabase = client
         if not self._current_user:
@@ -180,10 +183,11 @@ class AuthService:
         return self._user_info
     
     @classmethod
-    def create_client(cls) -> Client:
+    def create_client(cls) -> 'Client':
         """Create unauthenticated Supabase client"""
         if not config.is_configured():
             raise Exception("Application not configured")
+        from supabase import create_client
         return create_client(config.supabase_url, config.supabase_anon_key)
 
 
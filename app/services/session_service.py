@@ -5,14 +5,35 @@ SECURE STORAGE - Uses system keyring for token storage.
 """
 
 import json
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Tuple, Dict
-import keyring
-
-from supabase import create_client, Client
+from typing import TYPE_CHECKING, Optional, Tuple, Dict
 
 from app.config import config
 
+if TYPE_CHECKING:
+    # Type-only: keyring and supabase are imported where they are used
+    from supabase import Client
+
+try:
+    import orjson  # Optional: faster (de)serialization of the session blob
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Dict) -> str:
+    """Serialize session data compactly (keyring stores str)"""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(',', ':'))
+
+
+def _loads(json_str: str) -> Dict:
+    """Parse a serialized session blob"""
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
 
 class SessionService:
     """Session persistence manager using system keyring"""
@@ -20,69 +41,106 @@ class SessionService:
     SESSION_DURATION_DAYS = 7
     SERVICE_NAME = "ChronosApp"
     USERNAME = "session_data"
+    EXPIRY_USERNAME = "session_expires_at"
+    CACHE_TTL_SECONDS = 60
+    PERMISSIONS_TTL_SECONDS = 3600
     
     def __init__(self):
-        pass
+        # In-memory result of the last successful load_session
+        self._cached: Optional[Tuple['Client', Dict]] = None
+        self._cached_at: float = 0
     
-    def save_session(self, supabase: Client, user_info: Dict) -> None:
+    def save_session(
+        self,
+        supabase: 'Client',
+        user_info: Dict,
+        permissions_refreshed_at: Optional[float] = None
+    ) -> None:
         """
         Save current session securely.
         
         Args:
             supabase: Authenticated Supabase client
             user_info: User information dict
+            permissions_refreshed_at: Epoch time user_info was fetched (defaults to now)
         """
+        self._cached = None
+        if permissions_refreshed_at is None:
+            permissions_refreshed_at = time.time()
+        
         try:
             session = supabase.auth.get_session()
             if not session:
                 return
             
+            expires = datetime.now() + timedelta(days=self.SESSION_DURATION_DAYS)
+            expires_session_at = expires.timestamp()
+            
             # Session data
             session_data = {
                 "access_token": session.access_token,
                 "refresh_token": session.refresh_token,
                 "expires_at": session.expires_at,
                 "user_info": user_info,
+                "permissions_refreshed_at": permissions_refreshed_at,
                 "saved_at": datetime.now().isoformat(),
-                "expires_session_at": (datetime.now() + timedelta(days=self.SESSION_DURATION_DAYS)).isoformat()
+                "expires_session_at": expires_session_at,
+                "expires_session_at_iso": expires.isoformat()  # Human-readable, not read back
             }
             
-            # Save to keyring
-            json_str = json.dumps(session_data)
+            # Save to keyring (compact output keeps the secret small)
+            import keyring
+            json_str = _dumps(session_data)
             keyring.set_password(self.SERVICE_NAME, self.USERNAME, json_str)
+            # Expiry stored separately so freshness checks skip the full blob
+            keyring.set_password(self.SERVICE_NAME, self.EXPIRY_USERNAME, repr(expires_session_at))
             
             print(f"✓ Session saved securely (expires in {self.SESSION_DURATION_DAYS} days)")
         
         except Exception as e:
             print(f"Warning: Could not save session: {e}")
     
-    def load_session(self) -> Optional[Tuple[Client, Dict]]:
+    def load_session(self, force_refresh: bool = False) -> Optional[Tuple['Client', Dict]]:
         """
         Load and validate saved session from keyring.
         
+        Args:
+            force_refresh: Re-fetch permissions even if the stored ones are fresh
+        
         Returns:
             Tuple (supabase_client, user_info) if session is valid
             None if no session or expired
         """
+        if not force_refresh and self._cached and time.monotonic() - self._cached_at < self.CACHE_TTL_SECONDS:
+            return self._cached
+        
         try:
             if not config.is_configured():
                 return None
             
+            # Cheap expiry check before pulling the whole session blob
+            if self._is_expired():
+                print("Session expired, please login again")
+                self.clear_session()
+                return None
+            
             # Read session from keyring
+            import keyring
             json_str = keyring.get_password(self.SERVICE_NAME, self.USERNAME)
             if not json_str:
                 return None
                 
-            session_data = json.loads(json_str)
+            session_data = _loads(json_str)
+            permissions_refreshed_at = session_data.get("permissions_refreshed_at", 0)
             
             # Check session expiry
-            expires_session_at = datetime.fromisoformat(session_data["expires_session_at"])
-            if datetime.now() > expires_session_at:
+            if time.time() > self._to_epoch(session_data["expires_session_at"]):
                 print("Session expired, please login again")
                 self.clear_session()
                 return None
             
             # Create client with saved token
+            from supabase import create_client
             supabase = create_client(
                 config.supabase_url,
                 config.supabase_anon_key
@@ -90,25 +148,19 @@ class SessionService:
             
             # Restore session
             try:
-                # First try set_session which should auto-refresh if needed
-                supabase.auth.set_session(
-                    access_token=session_data["access_token"],
-                    refresh_token=session_data["refresh_token"]
-                )
-                
-                # Verify session is still valid
-                current_session = supabase.auth.get_session()
-                if not current_session:
-                    raise Exception("Session not restored")
-                
-                # Check if tokens rotated and save if needed
-                if (current_session.access_token != session_data["access_token"] or 
-                    current_session.refresh_token != session_data["refresh_token"]):
-                    print("Tokens rotated, updating secure storage...")
-                    self.save_session(supabase, session_data["user_info"])
+                # Optimistic restore: trust the stored JWT exp instead of a
+                # get_session() round-trip. set_session raises on bad tokens.
+                if (session_data.get("expires_at") or 0) > time.time() + 30:
+                    supabase.auth.set_session(
+                        access_token=session_data["access_token"],
+                        refresh_token=session_data["refresh_token"]
+                    )
+                else:
+                    # Access token is (about to be) expired: refresh below
+                    raise Exception("JWT expired")
                 
             except Exception as e:
-                # set_session failed, try explicit refresh
+                # set_session failed or JWT expired, try explicit refresh
                 error_str = str(e).lower()
                 if "expired" in error_str or "invalid" in error_str:
                     print(f"JWT expired, attempting refresh...")
@@ -118,7 +170,7 @@ class SessionService:
                         if refresh_response and refresh_response.session:
                             print("✓ Session refreshed successfully")
                             # Save the new tokens
-                            self.save_session(supabase, session_data["user_info"])
+                            self.save_session(supabase, session_data["user_info"], permissions_refreshed_at)
                         else:
                             raise Exception("Refresh failed")
                     except Exception as refresh_error:
@@ -130,7 +182,7 @@ class SessionService:
                     self.clear_session()
                     return None
             
-            # ALWAYS refresh user info from database to ensure permissions are up to date
+            # Refresh user info from database once permissions are older than the TTL
             # This is critical after app updates where session format might have changed
             try:
                 from app.services.auth_service import auth_service
@@ -144,15 +196,19 @@ class SessionService:
                     self.clear_session()
                     return None
                 
-                # Always fetch fresh permissions from database
-                user_info = auth_service.get_user_info(supabase, user_id)
-                
-                # Verify we got valid permissions
-                if not user_info.get("permissions"):
-                    print("Warning: No permissions found for user")
-                
-                # Update session data with fresh user info (including fresh permissions)
-                self.save_session(supabase, user_info)
+                permissions_stale = time.time() - permissions_refreshed_at > self.PERMISSIONS_TTL_SECONDS
+                if force_refresh or permissions_stale:
+                    # Fetch fresh permissions from database
+                    user_info = auth_service.get_user_info(supabase, user_id)
+                    
+                    # Verify we got valid permissions
+                    if not user_info.get("permissions"):
+                        print("Warning: No permissions found for user")
+                    
+                    # Update session data with fresh user info (including fresh permissions)
+                    self.save_session(supabase, user_info)
+                else:
+                    user_info = old_user_info
                 
             except Exception as e:
                 print(f"Could not refresh user info: {e}")
@@ -162,7 +218,9 @@ class SessionService:
             
             print(f"✓ Session restored for {user_info.get('email', 'user')}")
             
-            return supabase, user_info
+            self._cached = (supabase, user_info)
+            self._cached_at = time.monotonic()
+            return self._cached
         
         except Exception as e:
             print(f"Error loading session: {e}")
@@ -171,6 +229,8 @@ class SessionService:
     
     def clear_session(self) -> None:
         """Delete saved session"""
+        self._cached = None
+        import keyring
         try:
             keyring.delete_password(self.SERVICE_NAME, self.USERNAME)
             print("✓ Session cleared")
@@ -178,9 +238,45 @@ class SessionService:
             pass # Password not found, that's fine
         except Exception as e:
             print(f"Error clearing session: {e}")
+        
+        try:
+            keyring.delete_password(self.SERVICE_NAME, self.EXPIRY_USERNAME)
+        except keyring.errors.PasswordDeleteError:
+            pass
+        except Exception as e:
+            print(f"Error clearing session expiry: {e}")
+    
+    @staticmethod
+    def _to_epoch(value) -> float:
+        """Session expiry as epoch seconds (older sessions stored an ISO string)"""
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                return datetime.fromisoformat(value).timestamp()
+        return value
+    
+    def _read_expiry(self) -> Optional[float]:
+        """Read the standalone expiry entry (None if missing or unreadable)"""
+        try:
+            import keyring
+            value = keyring.get_password(self.SERVICE_NAME, self.EXPIRY_USERNAME)
+            return self._to_epoch(value) if value else None
+        except Exception:
+            return None
+    
+    def _is_expired(self) -> bool:
+        """True only when the expiry entry exists and is in the past"""
+        expires_session_at = self._read_expiry()
+        return expires_session_at is not None and time.time() > expires_session_at
     
     def has_saved_session(self) -> bool:
-        """Check if a saved session exists"""
+        """Check if a saved, non-expired session exists"""
+        expires_session_at = self._read_expiry()
+        if expires_session_at is not None:
+            return time.time() <= expires_session_at
+        # Sessions saved before the expiry entry existed
+        import keyring
         return keyring.get_password(self.SERVICE_NAME, self.USERNAME) is not None
 
 
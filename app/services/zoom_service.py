@@ -3,25 +3,45 @@ Chronos - Zoom Service
 Servicio para interacción con la API de Zoom.
 """
 
+import asyncio
+import atexit
 import base64
+import functools
 import logging
+import threading
+import time
 from datetime import datetime
-from typing import Optional
-
-import httpx
-from supabase import Client
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from app.config import config
+from app.http import http2_available
+
+if TYPE_CHECKING:
+    # Solo para anotaciones: httpx y supabase se importan al usarse
+    import httpx
+    from supabase import Client
 
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _bearer_headers(access_token: str) -> dict:
+    """Headers JSON + Bearer para un token (compartidos: no modificar)."""
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": "application/json"
+    }
+
+
 class ZoomService:
     """Servicio singleton para manejar operaciones de Zoom."""
     
     _instance: Optional['ZoomService'] = None
     
+    _MEETING_URL = "https://api.zoom.us/v2/meetings/{}"
+    _USER_MEETINGS_URL = "https://api.zoom.us/v2/users/{}/meetings"
+    
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -34,12 +54,57 @@ class ZoomService:
             
         self._client_id: Optional[str] = None
         self._client_secret: Optional[str] = None
+        self._basic_auth_header: Optional[str] = None
+        
+        # Último access_token obtenido y su expiración (reloj monotónico)
+        self._access_token: Optional[str] = None
+        self._access_expires_at: float = 0
+        # Fila de zoom_tokens y refresh_token vigente (evita el SELECT en cada refresh)
+        self._token_record_id = None
+        self._refresh_token: Optional[str] = None
+        self._token_lock = threading.Lock()
+        
+        # Cliente HTTP compartido, creado en la primera petición
+        self._client: Optional['httpx.Client'] = None
+        atexit.register(self.close)
         self._initialized = True
     
+    @property
+    def _http(self) -> 'httpx.Client':
+        """Cliente HTTP compartido: reutiliza conexiones TCP/TLS entre llamadas."""
+        if self._client is None:
+            import httpx
+            self._client = httpx.Client(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=8)
+            )
+        return self._client
+    
+    def async_client(self) -> 'httpx.AsyncClient':
+        """
+        Cliente asíncrono para un lote de peticiones (usar con `async with`).
+        Con h2 instalado usa HTTP/2: las peticiones comparten una conexión.
+        """
+        import httpx
+        return httpx.AsyncClient(timeout=10.0, http2=http2_available())
+    
+    def close(self) -> None:
+        """Cierra el cliente HTTP compartido."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+    
     def set_credentials(self, client_id: str, client_secret: str) -> None:
         """Establece las credenciales de Zoom."""
         self._client_id = client_id
         self._client_secret = client_secret
+        self._basic_auth_header = None
+        if client_id and client_secret:
+            auth_str = f"{client_id}:{client_secret}"
+            self._basic_auth_header = "Basic " + base64.b64encode(auth_str.encode()).decode()
+        self._access_token = None
+        self._access_expires_at = 0
+        self._refresh_token = None
         logger.info("Zoom credentials configured")
     
     @property
@@ -55,9 +120,10 @@ class ZoomService:
         """Verifica si las credenciales están configuradas."""
         return bool(self._client_id and self._client_secret)
     
-    def refresh_token(self, supabase: Client) -> str:
+    def refresh_token(self, supabase: 'Client') -> str:
         """
         Refresca el token de Zoom usando el refresh_token almacenado.
+        Si el último token obtenido sigue vigente, se devuelve sin ir a la red.
         
         Args:
             supabase: Cliente de Supabase autenticado
@@ -68,31 +134,72 @@ class ZoomService:
         Raises:
             Exception: Si no hay credenciales o falla el refresh
         """
-        logger.debug("Refreshing Zoom Token...")
-        
-        # 1. Obtener refresh_token actual
-        resp = supabase.table("zoom_tokens").select("id, refresh_token").limit(1).execute()
-        if not resp.data:
-            raise Exception("No token record found in DB")
-        
-        record = resp.data[0]
-        refresh_token = record.get("refresh_token")
-        
-        if not refresh_token:
-            raise Exception("No refresh_token found in DB")
+        with self._token_lock:
+            # Reutilizar el token mientras le quede más de un minuto de vida
+            if self._access_token and time.monotonic() < self._access_expires_at - 60:
+                return self._access_token
             
-        if not self._client_id or not self._client_secret:
-            raise Exception("Missing Zoom CLIENT_ID or CLIENT_SECRET")
+            logger.debug("Refreshing Zoom Token...")
             
-        # 2. Llamar a Zoom API
+            if not self._basic_auth_header:
+                raise Exception("Missing Zoom CLIENT_ID or CLIENT_SECRET")
+            
+            # 1. Usar el refresh_token que guardamos en el último refresh
+            response = None
+            if self._refresh_token:
+                refresh_token = self._refresh_token
+                response = self._request_token(refresh_token)
+                if response.status_code != 200:
+                    # Otro cliente pudo rotarlo: releer de la DB
+                    logger.debug("Cached refresh_token rejected, reloading from DB")
+                    response = None
+            
+            if response is None:
+                resp = supabase.table("zoom_tokens").select("id, refresh_token").limit(1).maybe_single().execute()
+                # Según la versión de postgrest, maybe_single() devuelve None si no hay filas
+                if not resp or not resp.data:
+                    raise Exception("No token record found in DB")
+                
+                record = resp.data
+                refresh_token = record.get("refresh_token")
+                
+                if not refresh_token:
+                    raise Exception("No refresh_token found in DB")
+                
+                self._token_record_id = record["id"]
+                
+                # 2. Llamar a Zoom API
+                response = self._request_token(refresh_token)
+            
+            if response.status_code != 200:
+                self._refresh_token = None
+                logger.error(f"Failed to refresh token: {response.text}")
+                raise Exception(f"Failed to refresh token: {response.text}")
+            
+            new_tokens = response.json()
+            new_access_token = new_tokens["access_token"]
+            new_refresh_token = new_tokens.get("refresh_token", refresh_token)
+            
+            # 3. Actualizar DB
+            supabase.table("zoom_tokens").update({
+                "access_token": new_access_token,
+                "refresh_token": new_refresh_token,
+                "updated_at": datetime.now().isoformat()
+            }).eq("id", self._token_record_id).execute()
+            
+            self._refresh_token = new_refresh_token
+            self._access_token = new_access_token
+            self._access_expires_at = time.monotonic() + new_tokens.get("expires_in", 3600)
+            
+            logger.info("Zoom token refreshed successfully")
+            return new_access_token
+    
+    def _request_token(self, refresh_token: str) -> 'httpx.Response':
+        """Canjea un refresh_token en el endpoint OAuth de Zoom."""
         url = "https://zoom.us/oauth/token"
         
-        # Basic Auth Header
-        auth_str = f"{self._client_id}:{self._client_secret}"
-        b64_auth = base64.b64encode(auth_str.encode()).decode()
-        
         headers = {
-            "Authorization": f"Basic {b64_auth}",
+            "Authorization": self._basic_auth_header,
             "Content-Type": "application/x-www-form-urlencoded"
         }
         
@@ -101,25 +208,7 @@ class ZoomService:
             "refresh_token": refresh_token
         }
         
-        response = httpx.post(url, headers=headers, data=data, timeout=10.0)
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to refresh token: {response.text}")
-            raise Exception(f"Failed to refresh token: {response.text}")
-            
-        new_tokens = response.json()
-        new_access_token = new_tokens["access_token"]
-        new_refresh_token = new_tokens.get("refresh_token", refresh_token)
-        
-        # 3. Actualizar DB
-        supabase.table("zoom_tokens").update({
-            "access_token": new_access_token,
-            "refresh_token": new_refresh_token,
-            "updated_at": datetime.now().isoformat()
-        }).eq("id", record["id"]).execute()
-        
-        logger.info("Zoom token refreshed successfully")
-        return new_access_token
+        return self._http.post(url, headers=headers, data=data)
     
     def update_meeting_host(
         self, 
@@ -138,18 +227,54 @@ class ZoomService:
         Returns:
             Respuesta de la API
         """
-        url = f"https://api.zoom.us/v2/meetings/{meeting_id}"
+        url = self._MEETING_URL.format(meeting_id)
         
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
+        headers = _bearer_headers(access_token)
+        
+        data = {
+            "schedule_for": new_host_email
         }
         
+        response = self._http.patch(url, headers=headers, json=data)
+        
+        if response.status_code not in [200, 204]:
+            logger.error(f"Failed to update meeting {meeting_id}: {response.text}")
+            raise Exception(f"Failed to update meeting: {response.text}")
+        
+        logger.debug(f"Meeting {meeting_id} host updated to {new_host_email}")
+        return {"success": True, "meeting_id": meeting_id}
+
+    async def update_meeting_host_async(
+        self,
+        client: 'httpx.AsyncClient',
+        access_token: str,
+        meeting_id: str,
+        new_host_email: str,
+        max_retries: int = 3
+    ) -> dict:
+        """
+        Versión asíncrona de update_meeting_host sobre un AsyncClient compartido.
+        Respeta Retry-After cuando Zoom responde 429 (rate limit).
+        
+        Args:
+            client: Cliente HTTP asíncrono
+            access_token: Token de acceso de Zoom
+            meeting_id: ID de la reunión
+            new_host_email: Email del nuevo host
+            max_retries: Reintentos ante 429
+            
+        Returns:
+            Respuesta de la API
+        """
+        url = self._MEETING_URL.format(meeting_id)
+        
+        headers = _bearer_headers(access_token)
+        
         data = {
             "schedule_for": new_host_email
         }
         
-        response = httpx.patch(url, headers=headers, json=data, timeout=10.0)
+        response = await self._patch_async(client, url, headers, data, max_retries)
         
         if response.status_code not in [200, 204]:
             logger.error(f"Failed to update meeting {meeting_id}: {response.text}")
@@ -158,6 +283,72 @@ class ZoomService:
         logger.debug(f"Meeting {meeting_id} host updated to {new_host_email}")
         return {"success": True, "meeting_id": meeting_id}
 
+    @staticmethod
+    async def _patch_async(
+        client: 'httpx.AsyncClient',
+        url: str,
+        headers: dict,
+        data: dict,
+        max_retries: int,
+        timeout: Optional[float] = None
+    ) -> 'httpx.Response':
+        """PATCH que reintenta ante 429 esperando lo que indique Retry-After."""
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        for attempt in range(max_retries + 1):
+            response = await client.patch(url, headers=headers, json=data, **kwargs)
+            if response.status_code != 429 or attempt == max_retries:
+                break
+            
+            try:
+                delay = float(response.headers.get("Retry-After", 1))
+            except ValueError:
+                delay = 1.0
+            logger.debug(f"Rate limited on {url}, retrying in {delay}s")
+            await asyncio.sleep(delay)
+        return response
+
+    async def batch_update_meeting_hosts_async(
+        self,
+        access_token: str,
+        items: List[Tuple[str, str]],
+        concurrency: int = 8
+    ) -> List[dict]:
+        """
+        Actualiza el host de varias reuniones en paralelo (concurrencia acotada).
+        
+        Args:
+            access_token: Token de acceso de Zoom
+            items: Lista de tuplas (meeting_id, new_host_email)
+            concurrency: Máximo de peticiones simultáneas
+            
+        Returns:
+            Un resultado por item, en el mismo orden
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async with self.async_client() as client:
+            async def _one(meeting_id: str, new_host_email: str) -> dict:
+                async with semaphore:
+                    try:
+                        return await self.update_meeting_host_async(
+                            client, access_token, meeting_id, new_host_email
+                        )
+                    except Exception as e:
+                        return {"success": False, "meeting_id": meeting_id, "error": str(e)}
+            
+            return await asyncio.gather(*[_one(mid, email) for mid, email in items])
+
+    def batch_update_meeting_hosts(
+        self,
+        access_token: str,
+        items: List[Tuple[str, str]],
+        concurrency: int = 8
+    ) -> List[dict]:
+        """Wrapper síncrono de batch_update_meeting_hosts_async (para workers)."""
+        return asyncio.run(
+            self.batch_update_meeting_hosts_async(access_token, items, concurrency)
+        )
+
     def create_meeting(
         self,
         access_token: str,
@@ -181,12 +372,9 @@ class ZoomService:
         Returns:
             Datos de la reunión creada
         """
-        url = f"https://api.zoom.us/v2/users/{user_id}/meetings"
+        url = self._USER_MEETINGS_URL.format(user_id)
         
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
+        headers = _bearer_headers(access_token)
         
         data = {
             "topic": topic,
@@ -206,7 +394,7 @@ class ZoomService:
         if recurrence:
             data["recurrence"] = recurrence
             
-        response = httpx.post(url, headers=headers, json=data, timeout=15.0)
+        response = self._http.post(url, headers=headers, json=data, timeout=15.0)
         
         if response.status_code != 201:
             logger.error(f"Failed to create meeting: {response.text}")
@@ -237,13 +425,72 @@ class ZoomService:
         Returns:
             Éxito o error
         """
-        url = f"https://api.zoom.us/v2/meetings/{meeting_id}"
+        url = self._MEETING_URL.format(meeting_id)
         
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
+        headers = _bearer_headers(access_token)
+        
+        data = self._update_payload(topic, start_time, duration, recurrence)
+            
+        response = self._http.patch(url, headers=headers, json=data, timeout=15.0)
+        
+        if response.status_code not in [200, 204]:
+            logger.error(f"Failed to update meeting {meeting_id}: {response.text}")
+            raise Exception(f"Failed to update meeting: {response.text}")
+        
+        logger.debug(f"Meeting {meeting_id} updated successfully")
+        return {"success": True, "meeting_id": meeting_id}
+
+    async def update_meeting_async(
+        self,
+        client: 'httpx.AsyncClient',
+        access_token: str,
+        meeting_id: str,
+        topic: str,
+        start_time: str,
+        duration: int = 60,
+        recurrence: Optional[dict] = None,
+        max_retries: int = 3
+    ) -> dict:
+        """
+        Versión asíncrona de update_meeting sobre un AsyncClient compartido.
+        Respeta Retry-After cuando Zoom responde 429 (rate limit).
         
+        Args:
+            client: Cliente HTTP asíncrono
+            access_token: Token de acceso
+            meeting_id: ID de la reunión a actualizar
+            topic: Nuevo tema de la reunión
+            start_time: Nueva hora de inicio (ISO 8601)
+            duration: Duración en minutos
+            recurrence: Configuración de recurrencia (opcional)
+            max_retries: Reintentos ante 429
+            
+        Returns:
+            Éxito o error
+        """
+        url = self._MEETING_URL.format(meeting_id)
+        
+        headers = _bearer_headers(access_token)
+        
+        data = self._update_payload(topic, start_time, duration, recurrence)
+        
+        response = await self._patch_async(client, url, headers, data, max_retries, timeout=15.0)
+        
+        if response.status_code not in [200, 204]:
+            logger.error(f"Failed to update meeting {meeting_id}: {response.text}")
+            raise Exception(f"Failed to update meeting: {response.text}")
+        
+        logger.debug(f"Meeting {meeting_id} updated successfully")
+        return {"success": True, "meeting_id": meeting_id}
+
+    @staticmethod
+    def _update_payload(
+        topic: str,
+        start_time: str,
+        duration: int,
+        recurrence: Optional[dict]
+    ) -> dict:
+        """Cuerpo del PATCH de update_meeting / update_meeting_async."""
         data = {
             "topic": topic,
             "type": 8 if recurrence else 2,
@@ -261,15 +508,7 @@ class ZoomService:
         
         if recurrence:
             data["recurrence"] = recurrence
-            
-        response = httpx.patch(url, headers=headers, json=data, timeout=15.0)
-        
-        if response.status_code not in [200, 204]:
-            logger.error(f"Failed to update meeting {meeting_id}: {response.text}")
-            raise Exception(f"Failed to update meeting: {response.text}")
-        
-        logger.debug(f"Meeting {meeting_id} updated successfully")
-        return {"success": True, "meeting_id": meeting_id}
+        return data
 
 
 # Instancia global del servicio
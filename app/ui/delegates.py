@@ -3,29 +3,102 @@ Chronos - UI Delegates
 Custom delegates for table styling and interaction.
 """
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
-    QStyledItemDelegate, QHeaderView, QLineEdit, QStyle, QStyleOptionButton
+    QStyledItemDelegate, QHeaderView, QLineEdit, QStyle, QStyleOptionButton,
+    QAbstractItemView
 )
-from PyQt6.QtGui import QColor, QPainter, QPen
-from PyQt6.QtCore import Qt, QModelIndex, QRect, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QPen, QFontMetrics
+from PyQt6.QtCore import Qt, QModelIndex, QRect, QEvent, pyqtSignal
 
 from theme_manager import theme
 
 
+# Métricas por fuente (QFont.key()) para medir texto sin re-crear QFontMetrics
+_font_metrics = {}
+
+
+@lru_cache(maxsize=4096)
+def _text_width(font_key: str, text: str) -> int:
+    """Ancho en píxeles de `text` con la fuente identificada por `font_key`."""
+    return _font_metrics[font_key].horizontalAdvance(text)
+
+
 class RowHoverDelegate(QStyledItemDelegate):
     """Delegate para resaltar la fila completa al pasar el mouse."""
     
-    def __init__(self, parent=None, hover_color=None):
+    def __init__(self, parent=None, hover_color=None, separator_color=None):
         super().__init__(parent)
         self.hover_color = QColor(hover_color or theme.colors.surface_secondary)
         self.hover_row = -1
+        # Línea inferior de cada celda (reemplaza border-bottom en QSS)
+        self.separator_color = QColor(separator_color) if separator_color else None
+        
+        # Limpiar el hover cuando el mouse sale de la tabla
+        self._view = parent if isinstance(parent, QAbstractItemView) else None
+        self._viewport = self._view.viewport() if self._view is not None else None
+        if self._viewport is not None:
+            self._viewport.installEventFilter(self)
+        
+        # Estilo del editor (depende solo del tema: se compone una vez)
+        self._editor_stylesheet = f"""
+            QLineEdit {{
+                border: 1px solid {theme.colors.border};
+                border-radius: 4px;
+                background-color: {theme.colors.surface}; 
+                color: {theme.colors.text_primary};
+                selection-background-color: {theme.colors.primary};
+                selection-color: {theme.colors.primary_foreground};
+                padding: 0 4px;
+            }}
+        """
+
+    def set_hover_row(self, row: int):
+        """Cambia la fila resaltada y repinta solo la fila anterior y la nueva."""
+        if row == self.hover_row:
+            return
+        previous_row = self.hover_row
+        self.hover_row = row
+        if self._viewport is None:
+            return
+        
+        for r in (previous_row, row):
+            if r < 0:
+                continue
+            rect = self._row_rect(r)
+            if rect.isValid():
+                self._viewport.update(rect)
+            else:
+                # Fila fuera del modelo o sin geometría: repintar todo
+                self._viewport.update()
+                return
+
+    def _row_rect(self, row: int) -> QRect:
+        """Rectángulo (en coordenadas del viewport) que ocupa la fila completa."""
+        model = self._view.model()
+        if model is None or row >= model.rowCount():
+            return QRect()
+        rect = self._view.visualRect(model.index(row, 0))
+        return QRect(0, rect.top(), self._viewport.width(), rect.height())
+
+    def eventFilter(self, obj, event):
+        if obj is self._viewport:
+            if event.type() == QEvent.Type.Leave:
+                self.set_hover_row(-1)
+            return False
+        return super().eventFilter(obj, event)
 
     def paint(self, painter: QPainter, option, index: QModelIndex):
-        if index.row() == self.hover_row:
-            painter.save()
+        hover_row = self.hover_row
+        if hover_row >= 0 and index.row() == hover_row:
+            # fillRect no altera el estado del painter: no hace falta save/restore
             painter.fillRect(option.rect, self.hover_color)
-            painter.restore()
         super().paint(painter, option, index)
+        
+        if self.separator_color is not None:
+            rect = option.rect
+            painter.fillRect(rect.left(), rect.bottom(), rect.width(), 1, self.separator_color)
 
     def createEditor(self, parent, option, index):
         """Crea un editor de solo lectura para permitir copiar texto."""
@@ -37,38 +110,41 @@ class RowHoverDelegate(QStyledItemDelegate):
         editor.setReadOnly(True)
         editor.setContextMenuPolicy(Qt.ContextMenuPolicy.NoContextMenu)
         
-        # Estilo del editor
-        editor.setStyleSheet(f"""
-            QLineEdit {{
-                border: 1px solid {theme.colors.border};
-                border-radius: 4px;
-                background-color: {theme.colors.surface}; 
-                color: {theme.colors.text_primary};
-                selection-background-color: {theme.colors.primary};
-                selection-color: {theme.colors.primary_foreground};
-                padding: 0 4px;
-            }}
-        """)
+        editor.setStyleSheet(self._editor_stylesheet)
         return editor
 
     def setEditorData(self, editor, index):
         """Establece los datos en el editor y su alineación."""
         text = index.model().data(index, Qt.ItemDataRole.DisplayRole)
-        editor.setText(str(text) if text else "")
+        text = str(text) if text else ""
+        editor.setText(text)
         
         # Sincronizar alineación
         alignment = index.model().data(index, Qt.ItemDataRole.TextAlignmentRole)
+        
+        # Guardar en el editor para que updateEditorGeometry no re-consulte el modelo
+        editor.setProperty("_cached_text", text)
+        editor.setProperty("_cached_align", alignment)
+        
         if alignment:
             horizontal_align = alignment & Qt.AlignmentFlag.AlignHorizontal_Mask
             editor.setAlignment(Qt.AlignmentFlag(horizontal_align))
 
     def updateEditorGeometry(self, editor, option, index):
         """Ajusta el tamaño del editor al contenido del texto (fit-content)."""
-        text = str(index.model().data(index, Qt.ItemDataRole.DisplayRole) or "")
+        text = editor.property("_cached_text")
+        if text is not None:
+            alignment = editor.property("_cached_align")
+        else:
+            # Primera geometría: Qt la pide antes de setEditorData
+            text = str(index.model().data(index, Qt.ItemDataRole.DisplayRole) or "")
+            alignment = index.model().data(index, Qt.ItemDataRole.TextAlignmentRole)
         
-        # Calcular ancho necesario
-        fm = option.fontMetrics
-        text_width = fm.horizontalAdvance(text)
+        # Calcular ancho necesario (memoizado por fuente y texto)
+        font_key = option.font.key()
+        if font_key not in _font_metrics:
+            _font_metrics[font_key] = QFontMetrics(option.font)
+        text_width = _text_width(font_key, text)
         required_width = text_width + 16  # Padding
         final_width = min(required_width, option.rect.width())
         
@@ -83,7 +159,6 @@ class RowHoverDelegate(QStyledItemDelegate):
         editor_rect.moveTop(option.rect.top() + vertical_diff)
         
         # Ajustar alineación horizontal
-        alignment = index.model().data(index, Qt.ItemDataRole.TextAlignmentRole)
         if alignment is None:
             alignment = Qt.AlignmentFlag.AlignLeft
             
@@ -110,18 +185,20 @@ class CheckBoxHeader(QHeaderView):
     def __init__(self, orientation, parent=None):
         super().__init__(orientation, parent)
         self.isOn = False
+        # Objetos de pintura del tema (fijo durante la ejecución)
+        self._bg_color = QColor(theme.colors.surface_secondary)
+        self._border_pen = QPen(QColor(theme.colors.border), 1)
 
     def paintSection(self, painter, rect, logicalIndex):
-        painter.save()
+        # QHeaderView.paintEvent ya envuelve cada sección en save/restore
         super().paintSection(painter, rect, logicalIndex)
-        painter.restore()
 
         if logicalIndex == 0:
             # Pintar fondo
-            painter.fillRect(rect, QColor(theme.colors.surface_secondary))
+            painter.fillRect(rect, self._bg_color)
             
             # Dibujar border bottom
-            painter.setPen(QPen(QColor(theme.colors.border), 1))
+            painter.setPen(self._border_pen)
             painter.drawLine(rect.x(), rect.bottom(), rect.right(), rect.bottom())
             
             # Dibujar checkbox
@@ -134,6 +211,7 @@ class CheckBoxHeader(QHeaderView):
             else:
                 option.state |= QStyle.StateFlag.State_Off
             
+            # style() se consulta al pintar: cambia si la tabla recibe un stylesheet
             self.style().drawControl(QStyle.ControlElement.CE_CheckBox, option, painter)
 
     def mousePressEvent(self, event):
@@ -3,10 +3,23 @@ Chronos - Dialogs Package
 Dialog components for the application.
 """
 
-from app.ui.dialogs.auto_assign import AutoAssignDialog
-from app.ui.dialogs.meeting_search import MeetingSearchDialog
-from app.ui.dialogs.setup_wizard import SetupWizard
-from app.ui.dialogs.link_creation import LinkCreationDialog
+from importlib import import_module
+
+# Dialogs are imported on first access: importing one dialog module (e.g. the
+# setup wizard at startup) must not load every other dialog's dependencies
+_EXPORTS = {
+    "AutoAssignDialog": "app.ui.dialogs.auto_assign",
+    "MeetingSearchDialog": "app.ui.dialogs.meeting_search",
+    "SetupWizard": "app.ui.dialogs.setup_wizard",
+    "LinkCreationDialog": "app.ui.dialogs.link_creation",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
 
 
 __all__ = [
@@ -4,24 +4,44 @@ Dialog for automatic meeting assignment based on schedule matching.
 """
 
 import logging
+from collections import Counter
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QProgressBar, QComboBox,
+    QTableView, QHeaderView, QProgressBar, QComboBox,
     QAbstractItemView, QFrame, QMessageBox, QMenu
 )
-from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtGui import QColor, QDesktopServices
-from PyQt6.QtCore import QItemSelectionModel
+from PyQt6.QtCore import Qt, QTimer, QUrl, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor, QFont, QDesktopServices
+from PyQt6.QtCore import QItemSelectionModel, QSignalBlocker
 
 from theme_manager import theme
 from app.ui.delegates import RowHoverDelegate, CheckBoxHeader
-from app.workers import AssignmentWorker, UpdateWorker
+from app.workers import WORKER_POOL, AssignmentWorker, UpdateWorker
 
 
 APP_NAME = "Chronos"
 logger = logging.getLogger(__name__)
 
+# Estilo de los botones de las alertas (se parsea una vez por alerta)
+MSGBOX_QSS = """
+    QMessageBox QPushButton {
+        background-color: #18181B;
+        color: #FAFAFA;
+        border: 1px solid #18181B;
+        border-radius: 6px;
+        padding: 4px 8px;
+        font-weight: 500;
+        min-width: 80px;
+    }
+    QMessageBox QPushButton:hover {
+        background-color: #27272A;
+    }
+    QMessageBox QPushButton:pressed {
+        background-color: #09090B;
+    }
+"""
+
 
 def custom_message_box(parent, title, text, icon, buttons):
     """Helper para mostrar alertas con estilos personalizados."""
@@ -32,26 +52,210 @@ def custom_message_box(parent, title, text, icon, buttons):
     msg.setStandardButtons(buttons)
     
     # Style the message box buttons
-    msg.setStyleSheet("""
-        QMessageBox QPushButton {
-            background-color: #18181B;
-            color: #FAFAFA;
-            border: 1px solid #18181B;
-            border-radius: 6px;
-            padding: 4px 8px;
-            font-weight: 500;
-            min-width: 80px;
-        }
-        QMessageBox QPushButton:hover {
-            background-color: #27272A;
-        }
-        QMessageBox QPushButton:pressed {
-            background-color: #09090B;
-        }
-    """)
+    msg.setStyleSheet(MSGBOX_QSS)
     return msg.exec()
 
 
+# Colores reutilizados por el modelo en cada data()
+COLOR_RED = QColor("#EF4444")
+COLOR_GREEN = QColor("#10B981")
+COLOR_AMBER = QColor("#F59E0B")
+COLOR_LINK = QColor("#2563EB")
+
+# Orden inicial de los resultados (primero lo ya asignado, luego lo accionable)
+STATUS_ORDER = {"assigned": 0, "to_update": 1, "not_found": 2}
+
+
+class AssignmentModel(QAbstractTableModel):
+    """
+    Modelo de solo lectura sobre los resultados de AssignmentWorker.
+    Las celdas se generan en data() solo cuando la vista las pinta.
+    """
+    
+    HEADERS = ["", "Status", "Meeting ID", "Time", "Instructor", "Program/Group", "Reason"]
+    
+    STATUS_DISPLAY = {"assigned": "Assigned", "to_update": "To Update"}
+    STATUS_COLORS = {"assigned": COLOR_GREEN, "to_update": COLOR_AMBER}
+    
+    # Flags precombinados (flags() se consulta por celda en cada repintado)
+    CHECK_FLAGS = Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    ROW_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    LINK_FLAGS = Qt.ItemFlag.ItemIsEnabled
+    
+    def __init__(self, results=None, parent=None):
+        super().__init__(parent)
+        self._link_font = QFont()
+        self._link_font.setUnderline(True)
+        self._results = results if results is not None else []
+        # Estado de los checkboxes (columna 0), uno por fila
+        self._check_states = bytearray(len(self._results))
+        self._checked_count = 0
+        self._build_filter_keys()
+    
+    def set_results(self, results):
+        """Reemplaza los resultados (sin copiar la lista)."""
+        self.beginResetModel()
+        self._results = results
+        self._check_states = bytearray(len(results))
+        self._checked_count = 0
+        self._build_filter_keys()
+        self.endResetModel()
+    
+    def _build_filter_keys(self):
+        """Precalcula (estado mostrado, instructor en minúsculas) por fila."""
+        self.filter_keys = [
+            (self.STATUS_DISPLAY.get(res["status"], "Not Found"), str(res["schedule"].instructor).lower())
+            for res in self._results
+        ]
+    
+    def result(self, row: int) -> dict:
+        return self._results[row]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._results)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def text(self, row: int, column: int) -> str:
+        """Texto mostrado en una celda (también usado para filtrar y ordenar)."""
+        res = self._results[row]
+        if column == 1:
+            return self.STATUS_DISPLAY.get(res["status"], "Not Found")
+        if column == 2:
+            return str(res["meeting_id"])
+        if column == 3:
+            return res["time_str"]
+        schedule = res["schedule"]
+        if column == 4:
+            return str(schedule.instructor)
+        if column == 5:
+            return str(schedule.program)
+        if column == 6:
+            return str(res["reason"])
+        return ""
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row, column = index.row(), index.column()
+        res = self._results[row]
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.text(row, column) if column else None
+        
+        if role == Qt.ItemDataRole.CheckStateRole:
+            if column == 0 and res["status"] == "to_update":
+                return Qt.CheckState.Checked if self._check_states[row] else Qt.CheckState.Unchecked
+            return None
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in (1, 2, 3, 6):
+                return Qt.AlignmentFlag.AlignCenter
+            return None
+        
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column == 1:
+                return self.STATUS_COLORS.get(res["status"], COLOR_RED)
+            if column == 2 and res["meeting_url"]:
+                return COLOR_LINK
+            return None
+        
+        if role == Qt.ItemDataRole.FontRole:
+            if column == 2 and res["meeting_url"]:
+                return self._link_font
+            return None
+        
+        if role == Qt.ItemDataRole.UserRole:
+            if column == 0 and res["status"] == "to_update":
+                return res.get("found_instructor")
+            if column == 2:
+                return res["meeting_url"]
+            return None
+        
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        
+        res = self._results[index.row()]
+        if res["status"] == "to_update":
+            return self.CHECK_FLAGS if index.column() == 0 else self.ROW_FLAGS
+        if index.column() == 2 and res["meeting_url"]:
+            # Link clicable aunque la fila no sea seleccionable
+            return self.LINK_FLAGS
+        return Qt.ItemFlag.NoItemFlags
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.CheckStateRole or index.column() != 0:
+            return False
+        if not self.is_checkable(index.row()):
+            return False
+        
+        if isinstance(value, int):
+            value = Qt.CheckState(value)
+        checked = value == Qt.CheckState.Checked
+        self._checked_count += checked - self._check_states[index.row()]
+        self._check_states[index.row()] = checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+    
+    def is_checkable(self, row: int) -> bool:
+        return self._results[row]["status"] == "to_update"
+    
+    def is_checked(self, row: int) -> bool:
+        return bool(self._check_states[row])
+    
+    def set_checked(self, rows, checked: bool) -> None:
+        """Marca o desmarca varias filas con una sola notificación a la vista."""
+        rows = [row for row in rows if self.is_checkable(row)]
+        if not rows:
+            return
+        
+        for row in rows:
+            self._checked_count += checked - self._check_states[row]
+            self._check_states[row] = checked
+        self.dataChanged.emit(
+            self.index(min(rows), 0), self.index(max(rows), 0),
+            [Qt.ItemDataRole.CheckStateRole]
+        )
+    
+    def checked_results(self) -> list:
+        return [res for res, checked in zip(self._results, self._check_states) if checked]
+    
+    def checked_count(self) -> int:
+        return self._checked_count
+    
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Ordena por el texto de la columna, conservando selección y checkboxes."""
+        self.layoutAboutToBeChanged.emit()
+        
+        order_rows = sorted(
+            range(len(self._results)),
+            key=lambda row: self.text(row, column),
+            reverse=order == Qt.SortOrder.DescendingOrder
+        )
+        self._results[:] = [self._results[row] for row in order_rows]
+        self._check_states = bytearray(self._check_states[row] for row in order_rows)
+        self.filter_keys = [self.filter_keys[row] for row in order_rows]
+        
+        new_rows = {old_row: new_row for new_row, old_row in enumerate(order_rows)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_rows[idx.row()], idx.column()) for idx in old_indexes]
+        )
+        
+        self.layoutChanged.emit()
+
+
 class AutoAssignDialog(QDialog):
     """Diálogo para configurar la asignación automática de reuniones."""
     
@@ -59,6 +263,13 @@ class AutoAssignDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle(f"{APP_NAME} | Auto Assign")
         self.setModal(True)
+        
+        # Progreso del worker: el título se actualiza como máximo cada 100 ms
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._apply_progress)
         self.setFixedSize(1200, 600)
         
         # Use theme colors
@@ -91,21 +302,6 @@ class AutoAssignDialog(QDialog):
                 font-weight: 500;
                 font-size: 14px;
             }}
-            QMessageBox QPushButton {{
-                background-color: #18181B;
-                color: #FAFAFA;
-                border: 1px solid #18181B;
-                border-radius: 6px;
-                padding: 4px 8px;
-                font-weight: 500;
-                min-width: 80px;
-            }}
-            QMessageBox QPushButton:hover {{
-                background-color: #27272A;
-            }}
-            QMessageBox QPushButton:pressed {{
-                background-color: #09090B;
-            }}
         """)
         
         layout = QVBoxLayout(self)
@@ -144,7 +340,12 @@ class AutoAssignDialog(QDialog):
                 border: 1px solid #18181B;
             }}
         """)
-        self.search_input.textChanged.connect(self.filter_table)
+        # Filtrar solo cuando se deja de escribir (un recorrido por ráfaga)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self.filter_table)
+        self.search_input.textChanged.connect(self._filter_timer.start)
 
         # Status Filter
         self.filter_combo = QComboBox()
@@ -178,7 +379,7 @@ class AutoAssignDialog(QDialog):
                 padding: 4px;
             }}
         """)
-        self.filter_combo.currentTextChanged.connect(self.filter_table)
+        self.filter_combo.currentTextChanged.connect(self._filter_timer.start)
         
         filter_layout.addWidget(self.search_input)
         filter_layout.addWidget(QLabel("Status:"))
@@ -203,11 +404,9 @@ class AutoAssignDialog(QDialog):
         layout.addWidget(self.progress_bar)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "", "Status", "Meeting ID", "Time", "Instructor", "Program/Group", "Reason"
-        ])
+        self.table = QTableView()
+        self.model = AssignmentModel(parent=self)
+        self.table.setModel(self.model)
         
         # Custom Header with Checkbox
         self.header = CheckBoxHeader(Qt.Orientation.Horizontal, self.table)
@@ -227,11 +426,14 @@ class AutoAssignDialog(QDialog):
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self.header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         self.table.verticalHeader().setVisible(False)
+        # Alto de fila fijo: Qt nunca mide el contenido de las celdas
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setMinimumSectionSize(45)
         self.table.verticalHeader().setDefaultSectionSize(45)
         
         # Table Styles
         self.table.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {self.COLORS['SURFACE']};
                 border: 1px solid {self.COLORS['BORDER']};
                 border-radius: 8px;
@@ -240,12 +442,11 @@ class AutoAssignDialog(QDialog):
                 font-family: 'IBM Plex Sans', sans-serif;
                 font-size: 14px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 12px;
-                border-bottom: 1px solid {self.COLORS['BORDER']};
                 color: {self.COLORS['TEXT_PRIMARY']};
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {self.COLORS['SURFACE_SECONDARY']};
                 color: {self.COLORS['TEXT_PRIMARY']};
             }}
@@ -282,8 +483,8 @@ class AutoAssignDialog(QDialog):
         layout.addWidget(self.table)
         
         # Connect selection signals
-        self.table.itemSelectionChanged.connect(self.on_selection_changed)
-        self.table.itemChanged.connect(self.on_item_changed)
+        self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.model.dataChanged.connect(self.on_item_changed)
         
         # Buttons
         btn_layout = QHBoxLayout()
@@ -347,35 +548,30 @@ class AutoAssignDialog(QDialog):
 
         # Hover Delegate
         self.table.setMouseTracking(True)
-        self.hover_delegate = RowHoverDelegate(self.table)
+        self.hover_delegate = RowHoverDelegate(self.table, separator_color=self.COLORS['BORDER'])
         self.table.setItemDelegate(self.hover_delegate)
-        self.table.cellEntered.connect(self.on_cell_entered)
-        self.table.cellClicked.connect(self.on_cell_clicked)
+        self.table.entered.connect(self.on_cell_entered)
+        self.table.clicked.connect(self.on_cell_clicked)
 
         # Context Menu
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.open_context_menu)
 
-    def on_cell_entered(self, row, column):
+    def on_cell_entered(self, index):
         """Maneja el evento de hover en las celdas."""
-        self.hover_delegate.hover_row = row
+        self.hover_delegate.set_hover_row(index.row())
         
-        item = self.table.item(row, column)
-        if column == 2 and item and item.data(Qt.ItemDataRole.UserRole):
+        if index.column() == 2 and index.data(Qt.ItemDataRole.UserRole):
             self.table.setCursor(Qt.CursorShape.PointingHandCursor)
         else:
             self.table.setCursor(Qt.CursorShape.ArrowCursor)
-             
-        self.table.viewport().update()
 
-    def on_cell_clicked(self, row, column):
+    def on_cell_clicked(self, index):
         """Maneja el clic en las celdas (para abrir links)."""
-        if column == 2:  # Meeting ID
-            item = self.table.item(row, column)
-            if item:
-                url = item.data(Qt.ItemDataRole.UserRole)
-                if url:
-                    QDesktopServices.openUrl(QUrl(url))
+        if index.column() == 2:  # Meeting ID
+            url = index.data(Qt.ItemDataRole.UserRole)
+            if url:
+                QDesktopServices.openUrl(QUrl(url))
 
     def open_context_menu(self, position):
         menu = QMenu()
@@ -408,76 +604,61 @@ class AutoAssignDialog(QDialog):
 
     def toggle_all_rows(self, state: bool):
         """Marca o desmarca todas las filas."""
-        self.table.blockSignals(True)
-        try:
-            check_state = Qt.CheckState.Checked if state else Qt.CheckState.Unchecked
-            
+        with QSignalBlocker(self.table):
             if state:
                 self.table.selectAll()
             else:
                 self.table.clearSelection()
-                
-            for i in range(self.table.rowCount()):
-                if self.table.isRowHidden(i):
-                    continue
-                    
-                item = self.table.item(i, 0)
-                if item and (item.flags() & Qt.ItemFlag.ItemIsEnabled):
-                    item.setCheckState(check_state)
-        finally:
-            self.table.blockSignals(False)
-            self.update_execute_button_text()
+            
+            self.model.set_checked(
+                (i for i in range(self.model.rowCount()) if not self.table.isRowHidden(i)),
+                state
+            )
+        self.update_execute_button_text()
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, selected, deselected):
         """Sincroniza la selección de filas con los checkboxes."""
         if self.table.signalsBlocked():
             return
 
-        self.table.blockSignals(True)
-        try:
-            selected_rows = {index.row() for index in self.table.selectedIndexes()}
-            
-            for i in range(self.table.rowCount()):
-                item = self.table.item(i, 0)
-                if not item or not (item.flags() & Qt.ItemFlag.ItemIsEnabled):
-                    continue
-                
-                should_be_checked = i in selected_rows
-                current_state = item.checkState() == Qt.CheckState.Checked
-                
-                if should_be_checked != current_state:
-                    item.setCheckState(Qt.CheckState.Checked if should_be_checked else Qt.CheckState.Unchecked)
-        finally:
-            self.table.blockSignals(False)
-            self.update_execute_button_text()
+        with QSignalBlocker(self.table):
+            # Solo las filas que cambiaron en este evento, no toda la tabla
+            selection_model = self.table.selectionModel()
+            self.model.set_checked({index.row() for index in selected.indexes()}, True)
+            self.model.set_checked(
+                {
+                    index.row() for index in deselected.indexes()
+                    if not selection_model.isSelected(index.siblingAtColumn(0))
+                },
+                False
+            )
+        self.update_execute_button_text()
 
-    def on_item_changed(self, item):
+    def on_item_changed(self, top_left, bottom_right, roles=None):
         """Sincroniza los checkboxes con la selección de filas."""
-        if item.column() == 0:
+        if top_left.column() == 0:
             if self.table.signalsBlocked():
                 return
 
-            self.table.blockSignals(True)
-            try:
-                row = item.row()
+            with QSignalBlocker(self.table):
+                row = top_left.row()
+                checked = self.model.is_checked(row)
                 selection_model = self.table.selectionModel()
-                if item.checkState() == Qt.CheckState.Checked:
+                if checked:
                     selection_model.select(
-                        self.table.model().index(row, 0),
+                        self.model.index(row, 0),
                         QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows
                     )
                 else:
                     selection_model.select(
-                        self.table.model().index(row, 0),
+                        self.model.index(row, 0),
                         QItemSelectionModel.SelectionFlag.Deselect | QItemSelectionModel.SelectionFlag.Rows
                     )
                 
-                if item.checkState() == Qt.CheckState.Unchecked and self.header.isOn:
+                if not checked and self.header.isOn:
                     self.header.isOn = False
                     self.header.viewport().update()
-            finally:
-                self.table.blockSignals(False)
-                self.update_execute_button_text()
+            self.update_execute_button_text()
 
     def process_data(self):
         """Inicia el procesamiento de datos (búsqueda de coincidencias)."""
@@ -487,7 +668,7 @@ class AutoAssignDialog(QDialog):
             
         self.start_btn.setEnabled(False)
         self.start_btn.setText("Processing...")
-        self.table.setRowCount(0)
+        self.model.set_results([])
         
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
@@ -495,16 +676,30 @@ class AutoAssignDialog(QDialog):
         self.worker = AssignmentWorker(self.schedules)
         self.worker.progress.connect(self.update_progress)
         self.worker.finished.connect(self.on_processing_finished)
-        self.worker.start()
+        WORKER_POOL.start(self.worker)
         
     def update_progress(self, msg):
-        self.setWindowTitle(f"{APP_NAME} | Auto Assign - {msg}")
+        self._pending_progress = msg
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _apply_progress(self):
+        """Muestra el último mensaje de progreso recibido."""
+        if self._pending_progress is not None:
+            self.setWindowTitle(f"{APP_NAME} | Auto Assign - {self._pending_progress}")
+            self._pending_progress = None
+
+    def _reset_title(self):
+        """Descarta el progreso pendiente y restaura el título."""
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self.setWindowTitle(f"{APP_NAME} | Auto Assign")
 
     def on_processing_finished(self, results, errors):
         """Maneja los resultados del procesamiento."""
         self.start_btn.setEnabled(True)
         self.start_btn.setText("Execute")
-        self.setWindowTitle(f"{APP_NAME} | Auto Assign")
+        self._reset_title()
         self.progress_bar.setVisible(False)
         
         if errors:
@@ -514,108 +709,27 @@ class AutoAssignDialog(QDialog):
             )
             return
             
-        self.table.setRowCount(len(results))
-        self.table.setSortingEnabled(False)
-        
-        to_update_count = 0
-        assigned_count = 0
-        not_found_count = 0
-        
-        for i, res in enumerate(results):
-            schedule = res["schedule"]
-            status = res["status"]
-            meeting_id = res["meeting_id"]
-            reason = res["reason"]
-            
-            if status == "assigned":
-                assigned_count += 1
-            elif status == "to_update":
-                to_update_count += 1
-            else:
-                not_found_count += 1
-            
-            found_instructor = res.get("found_instructor")
-            
-            # Checkbox
-            chk_item = QTableWidgetItem()
-            
-            if status == "to_update":
-                chk_item.setFlags(
-                    Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-                )
-                chk_item.setCheckState(Qt.CheckState.Unchecked)
-                if found_instructor:
-                    chk_item.setData(Qt.ItemDataRole.UserRole, found_instructor)
-            else:
-                chk_item.setFlags(Qt.ItemFlag.NoItemFlags)
-
-            self.table.setItem(i, 0, chk_item)
-            
-            # Status
-            display_status = "Not Found"
-            color = QColor("#EF4444")  # Red
-            
-            if status == "assigned":
-                display_status = "Assigned"
-                color = QColor("#10B981")  # Green
-            elif status == "to_update":
-                display_status = "To Update"
-                color = QColor("#F59E0B")  # Amber
-            
-            status_item = QTableWidgetItem(display_status)
-            status_item.setForeground(color)
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if status != "to_update":
-                status_item.setFlags(Qt.ItemFlag.NoItemFlags)
-            self.table.setItem(i, 1, status_item)
-            
-            # Helper para crear items
-            def create_item(text, align_center=False):
-                it = QTableWidgetItem(str(text))
-                if align_center:
-                    it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                if status != "to_update":
-                    it.setFlags(Qt.ItemFlag.NoItemFlags)
-                else:
-                    it.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-                return it
-
-            # Meeting ID
-            meeting_id_item = create_item(str(meeting_id), align_center=True)
-            if meeting_id and str(meeting_id) != "-" and str(meeting_id) != "":
-                meeting_id_item.setForeground(QColor("#2563EB"))
-                font = meeting_id_item.font()
-                font.setUnderline(True)
-                meeting_id_item.setFont(font)
-                meeting_id_item.setData(Qt.ItemDataRole.UserRole, f"https://zoom.us/meeting/{meeting_id}")
-                if status == "to_update":
-                    meeting_id_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-                else:
-                    meeting_id_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                 
-            self.table.setItem(i, 2, meeting_id_item)
-            
-            # Time
-            start_24h = schedule._convert_to_24h(schedule.start_time)
-            end_24h = schedule._convert_to_24h(schedule.end_time)
-            self.table.setItem(i, 3, create_item(f"{start_24h} - {end_24h}", align_center=True))
-            
-            # Instructor
-            self.table.setItem(i, 4, create_item(schedule.instructor))
-            
-            # Program
-            self.table.setItem(i, 5, create_item(schedule.program))
-            
-            # Reason
-            self.table.setItem(i, 6, create_item(reason, align_center=True))
-            
-        self.lbl_to_update.setText(f"To Update: {to_update_count}")
-        self.lbl_assigned.setText(f"Assigned: {assigned_count}")
-        self.lbl_not_found.setText(f"Not Found: {not_found_count}")
+        counts = Counter(res["status"] for res in results)
+        
+        # Ordenar la lista antes de entregarla al modelo: la vista no reordena nada
+        results.sort(key=lambda r: (STATUS_ORDER.get(r["status"], 2), str(r["schedule"].instructor)))
+        
+        # Reset y filtro se pintan una sola vez al final
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_results(results)
+            with QSignalBlocker(self.header):
+                # Sin indicador: el orden inicial no corresponde a una columna
+                self.header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+            self._filter_timer.stop()
+            self.filter_table()
+        finally:
+            self.table.setUpdatesEnabled(True)
+        
+        self.lbl_to_update.setText(f"To Update: {counts['to_update']}")
+        self.lbl_assigned.setText(f"Assigned: {counts['assigned']}")
+        self.lbl_not_found.setText(f"Not Found: {len(results) - counts['to_update'] - counts['assigned']}")
             
-        self.table.setSortingEnabled(True)
-        self.table.sortItems(1, Qt.SortOrder.AscendingOrder)
-        self.filter_table()
         self.update_execute_button_text()
         
     def filter_table(self, text=None):
@@ -625,60 +739,41 @@ class AutoAssignDialog(QDialog):
         
         search_terms = [term.strip() for term in search_text.split(',') if term.strip()]
         
-        for row in range(self.table.rowCount()):
-            status_item = self.table.item(row, 1)
-            if not status_item:
-                continue
-            
-            status = status_item.text()
-            status_match = (status_filter == "All") or (status_filter == status)
-            
-            instructor_item = self.table.item(row, 4)
-            instructor_name = instructor_item.text().lower() if instructor_item else ""
-            
-            if not search_terms:
-                search_match = True
-            else:
-                search_match = any(term in instructor_name for term in search_terms)
-            
-            self.table.setRowHidden(row, not (status_match and search_match))
+        updates_enabled = self.table.updatesEnabled()
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row, (status, instructor_name) in enumerate(self.model.filter_keys):
+                status_match = (status_filter == "All") or (status_filter == status)
+                
+                if not search_terms:
+                    search_match = True
+                else:
+                    search_match = any(term in instructor_name for term in search_terms)
+                
+                self.table.setRowHidden(row, not (status_match and search_match))
+        finally:
+            self.table.setUpdatesEnabled(updates_enabled)
 
     def update_execute_button_text(self):
         """Actualiza el texto del botón Execute con la cantidad de filas seleccionadas."""
-        count = sum(
-            1 for i in range(self.table.rowCount())
-            if (item := self.table.item(i, 0)) and item.checkState() == Qt.CheckState.Checked
-        )
+        count = self.model.checked_count()
         
         self.start_btn.setText(f"Execute ({count})" if count > 0 else "Execute")
 
     def execute_assignment(self):
         """Ejecuta la asignación para las filas seleccionadas."""
-        assignments = []
-        
-        for i in range(self.table.rowCount()):
-            item = self.table.item(i, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                found_instructor = item.data(Qt.ItemDataRole.UserRole)
-                meeting_id_item = self.table.item(i, 2)
-                time_item = self.table.item(i, 3)  # "HH:MM - HH:MM"
-                program_item = self.table.item(i, 5)
-                
-                if found_instructor and meeting_id_item:
-                    # Extract start_time from "HH:MM - HH:MM" format
-                    start_time = ""
-                    if time_item and time_item.text():
-                        time_parts = time_item.text().split(" - ")
-                        if time_parts:
-                            start_time = time_parts[0].strip()  # "HH:MM"
-                    
-                    assignments.append({
-                        "meeting_id": meeting_id_item.text(),
-                        "new_host_email": found_instructor.get("email"),
-                        "new_host_id": found_instructor.get("id"),
-                        "topic": program_item.text() if program_item else "Unknown Meeting",
-                        "start_time": start_time  # Add start time
-                    })
+        # Solo las filas marcadas, leídas directamente de los resultados
+        assignments = [
+            {
+                "meeting_id": str(res["meeting_id"]),
+                "new_host_email": res["found_instructor"].get("email"),
+                "new_host_id": res["found_instructor"].get("id"),
+                "topic": str(res["schedule"].program) or "Unknown Meeting",
+                "start_time": res["time_str"].split(" - ")[0]  # "HH:MM"
+            }
+            for res in self.model.checked_results()
+            if res.get("found_instructor")
+        ]
         
         if not assignments:
             custom_message_box(
@@ -710,7 +805,7 @@ class AutoAssignDialog(QDialog):
         self.update_worker = UpdateWorker(assignments, update_recurrence=True)
         self.update_worker.progress.connect(self.update_progress)
         self.update_worker.finished.connect(self.on_update_finished)
-        self.update_worker.start()
+        WORKER_POOL.start(self.update_worker)
 
     def on_update_finished(self, successes, errors):
         """Maneja el fin de la actualización."""
@@ -718,7 +813,7 @@ class AutoAssignDialog(QDialog):
         self.start_btn.setText("Execute")
         self.cancel_btn.setEnabled(True)
         self.table.setEnabled(True)
-        self.setWindowTitle(f"{APP_NAME} | Auto Assign")
+        self._reset_title()
         self.progress_bar.setVisible(False)
         
         msg = f"Process completed.\n\nSuccess: {len(successes)}\nErrors: {len(errors)}"
@@ -4,14 +4,15 @@ Dialog for creating Zoom links for a list of programs.
 """
 
 import logging
+from collections import Counter, deque
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QProgressBar, QComboBox,
+    QTableView, QHeaderView, QProgressBar, QComboBox,
     QAbstractItemView, QFrame, QMessageBox, QStyle, QMenu, QApplication
 )
-from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtGui import QColor, QDesktopServices
+from PyQt6.QtCore import Qt, QTimer, QUrl, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt6.QtGui import QColor, QFont, QDesktopServices
 
 from theme_manager import theme
 from app.workers import LinkCreationWorker
@@ -21,6 +22,47 @@ from app.ui.delegates import RowHoverDelegate
 APP_NAME = "Chronos"
 logger = logging.getLogger(__name__)
 
+# Estilos de los botones de las alertas (no dependen del tema)
+_SECONDARY_BTN_QSS = """
+    QPushButton {
+        background-color: #FFFFFF;
+        color: #09090B;
+        border: 1px solid #E4E4E7;
+        border-radius: 6px;
+        padding: 4px 8px;
+        font-family: 'IBM Plex Sans', sans-serif;
+        font-weight: 500;
+        font-size: 14px;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #F4F4F5;
+    }
+    QPushButton:pressed {
+        background-color: #E4E4E7;
+    }
+"""
+
+_PRIMARY_BTN_QSS = """
+    QPushButton {
+        background-color: #18181B;
+        color: #FAFAFA;
+        border: 1px solid #18181B;
+        border-radius: 6px;
+        padding: 4px 8px;
+        font-family: 'IBM Plex Sans', sans-serif;
+        font-weight: 500;
+        font-size: 14px;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #27272A;
+    }
+    QPushButton:pressed {
+        background-color: #09090B;
+    }
+"""
+
 
 def custom_message_box(parent, title, text, icon, buttons):
     """Helper para mostrar alertas con estilos personalizados en botones."""
@@ -58,25 +100,7 @@ def custom_message_box(parent, title, text, icon, buttons):
         if buttons & btn_type:
             btn = msg.button(btn_type)
             if btn:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #FFFFFF;
-                        color: #09090B;
-                        border: 1px solid #E4E4E7;
-                        border-radius: 6px;
-                        padding: 4px 8px;
-                        font-family: 'IBM Plex Sans', sans-serif;
-                        font-weight: 500;
-                        font-size: 14px;
-                        min-width: 80px;
-                    }
-                    QPushButton:hover {
-                        background-color: #F4F4F5;
-                    }
-                    QPushButton:pressed {
-                        background-color: #E4E4E7;
-                    }
-                """)
+                btn.setStyleSheet(_SECONDARY_BTN_QSS)
                 btn.setCursor(Qt.CursorShape.PointingHandCursor)
     
     # Estilizar botones primarios (Yes, Ok, Save, Open)
@@ -92,41 +116,196 @@ def custom_message_box(parent, title, text, icon, buttons):
         if buttons & btn_type:
             btn = msg.button(btn_type)
             if btn:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #18181B;
-                        color: #FAFAFA;
-                        border: 1px solid #18181B;
-                        border-radius: 6px;
-                        padding: 4px 8px;
-                        font-family: 'IBM Plex Sans', sans-serif;
-                        font-weight: 500;
-                        font-size: 14px;
-                        min-width: 80px;
-                    }
-                    QPushButton:hover {
-                        background-color: #27272A;
-                    }
-                    QPushButton:pressed {
-                        background-color: #09090B;
-                    }
-                """)
+                btn.setStyleSheet(_PRIMARY_BTN_QSS)
                 btn.setCursor(Qt.CursorShape.PointingHandCursor)
 
     return msg.exec()
 
 
-class LinkCreationDialog(QDialog):
+# Colores reutilizados por el modelo en cada data()
+_QC_GREEN = QColor("#16a34a")
+_QC_GRAY = QColor("#71717a")
+_QC_BLUE = QColor("#2563eb")
+_QC_RED = QColor("#dc2626")
+_LINK_COLOR = QColor("#2563EB")
+
+# Estado interno -> (texto mostrado, color); cubre todos los estados del worker
+_STATUS_DISPLAY = {
+    "ready": ("To Create", _QC_GREEN),
+    "existing": ("Existing", _QC_GRAY),
+    "to_update": ("To Update", _QC_BLUE),
+    "created": ("Created", _QC_GREEN),
+    "updated": ("Updated", _QC_BLUE),
+    "error": ("Error", _QC_RED),
+}
+
+
+def _status_display(status: str):
+    """(texto, color) de un estado; los desconocidos solo llegan por error."""
+    try:
+        return _STATUS_DISPLAY[status]
+    except KeyError:
+        return status.title(), _QC_GRAY
+
+
+class ResultsModel(QAbstractTableModel):
+    """
+    Modelo sobre la lista de resultados de LinkCreationWorker (sin copiarla).
+    Las celdas se generan en data() solo cuando la vista las pinta.
+    """
+    
+    HEADERS = ["Status", "Program", "Meeting ID", "Link"]
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(f"{APP_NAME} | Create Links")
-        self.setModal(True)
-        self.setFixedSize(900, 700)
-        
-        self.all_results = []
+        self._rows = []
+        self._link_font = QFont()
+        self._link_font.setUnderline(True)
+    
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def row(self, row: int) -> dict:
+        return self._rows[row]
+    
+    def update_rows(self, results: list) -> None:
+        """
+        Aplica resultados nuevos (por programa) sobre las filas existentes.
+        Solo se reemplazan y repintan las filas cuyo estado, ID o link cambió.
+        """
+        by_program = {r["program"]: r for r in results}
+        last_column = len(self.HEADERS) - 1
+        for i, res in enumerate(self._rows):
+            new = by_program.get(res["program"])
+            if new is None or (
+                new["status"] == res["status"]
+                and new["meeting_id"] == res["meeting_id"]
+                and new.get("join_url") == res.get("join_url")
+            ):
+                continue
+            self._rows[i] = new
+            self.dataChanged.emit(self.index(i, 0), self.index(i, last_column))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def text(self, row: int, column: int) -> str:
+        """Texto mostrado en una celda (también usado para copiar)."""
+        res = self._rows[row]
+        if column == 0:
+            return _status_display(res["status"])[0]
+        if column == 1:
+            return res["program"]
+        if column == 2:
+            return str(res["meeting_id"] or "")
+        return res.get("join_url") or ""
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row, column = index.row(), index.column()
+        res = self._rows[row]
+        
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.text(row, column)
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in (0, 2):
+                return Qt.AlignmentFlag.AlignCenter
+            return None
+        
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column == 0:
+                return _status_display(res["status"])[1]
+            if column in (2, 3) and self._has_link(res, column):
+                return _LINK_COLOR
+            return None
+        
+        if role == Qt.ItemDataRole.FontRole:
+            if column in (2, 3) and self._has_link(res, column):
+                return self._link_font
+            return None
+        
+        if role == Qt.ItemDataRole.UserRole:
+            if column == 0:
+                return res["status"]
+            if column == 2 and self._has_link(res, column):
+                return res["meeting_id"]  # La URL se arma al hacer clic
+            if column == 3 and self._has_link(res, column):
+                return res["join_url"]
+            return None
+        
+        return None
+    
+    @staticmethod
+    def _has_link(res: dict, column: int) -> bool:
+        value = res["meeting_id"] if column == 2 else res.get("join_url")
+        return bool(value) and value != "-"
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        # Editable solo para abrir el editor de solo lectura (copiar texto)
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """Cambia el estado interno de una fila (columna Status)."""
+        if role != Qt.ItemDataRole.EditRole or index.column() != 0:
+            return False
+        
+        self._rows[index.row()]["status"] = value
+        self.dataChanged.emit(
+            index, index,
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole, Qt.ItemDataRole.UserRole]
+        )
+        return True
+
+
+class ResultsProxyModel(QSortFilterProxyModel):
+    """
+    Ordenamiento de la tabla de resultados (lo resuelve el proxy; el modelo
+    conserva el orden del worker). Meeting ID se compara como número.
+    """
+    
+    def lessThan(self, left, right):
+        if left.column() == 2:
+            return self._id_key(left.data()) < self._id_key(right.data())
+        return super().lessThan(left, right)
+    
+    @staticmethod
+    def _id_key(value: str):
+        # IDs numéricos primero y en orden numérico; "" y "-" al final
+        return (0, int(value), "") if value.isdigit() else (1, 0, value)
+
+
+class LinkCreationDialog(QDialog):
+    # Estilos compuestos una sola vez por proceso (el tema no cambia en caliente)
+    _STYLES_BUILT = False
+    
+    # Ancho de la columna Program: se ajusta a una muestra de filas dentro de este rango
+    PROGRAM_MIN_WIDTH = 350
+    PROGRAM_MAX_WIDTH = 480
+    WIDTH_SAMPLE_ROWS = 50
+
+    @classmethod
+    def _build_styles(cls):
+        """Interpola los colores del tema en las hojas de estilo (solo la primera vez)."""
+        if cls._STYLES_BUILT:
+            return
         
         # Use theme colors
-        self.COLORS = {
+        cls.COLORS = c = {
             "BACKGROUND": theme.colors.background,
             "SURFACE": theme.colors.surface,
             "SURFACE_SECONDARY": theme.colors.surface_secondary,
@@ -136,39 +315,130 @@ class LinkCreationDialog(QDialog):
             "PRIMARY": theme.colors.primary,
             "PRIMARY_FOREGROUND": theme.colors.primary_foreground,
         }
-
-        self.setStyleSheet(f"""
-            QDialog {{ background-color: {self.COLORS['BACKGROUND']}; }}
-            QLabel {{ font-family: 'IBM Plex Sans', sans-serif; font-size: 14px; color: {self.COLORS['TEXT_PRIMARY']}; }}
+        
+        cls._TITLE_CSS = f"font-size: 18px; font-weight: 600; color: {c['TEXT_PRIMARY']};"
+        cls._DIALOG_CSS = f"""
+            QDialog {{ background-color: {c['BACKGROUND']}; }}
+            QLabel {{ font-family: 'IBM Plex Sans', sans-serif; font-size: 14px; color: {c['TEXT_PRIMARY']}; }}
             QTextEdit {{
-                font-family: 'IBM Plex Sans', sans-serif; 
-                border: 1px solid {self.COLORS['BORDER']}; 
-                border-radius: 6px; 
-                padding: 8px; 
-                background-color: {self.COLORS['SURFACE']}; 
-                color: {self.COLORS['TEXT_PRIMARY']}; 
+                font-family: 'IBM Plex Sans', sans-serif;
+                border: 1px solid {c['BORDER']};
+                border-radius: 6px;
+                padding: 8px;
+                background-color: {c['SURFACE']};
+                color: {c['TEXT_PRIMARY']};
                 font-size: 14px;
             }}
             QComboBox {{
-                font-family: 'IBM Plex Sans', sans-serif; border: 1px solid {self.COLORS['BORDER']}; border-radius: 6px; padding: 4px 8px; background-color: {self.COLORS['SURFACE']}; color: {self.COLORS['TEXT_PRIMARY']}; font-size: 14px;
+                font-family: 'IBM Plex Sans', sans-serif; border: 1px solid {c['BORDER']}; border-radius: 6px; padding: 4px 8px; background-color: {c['SURFACE']}; color: {c['TEXT_PRIMARY']}; font-size: 14px;
             }}
             QPushButton {{
                 font-family: 'IBM Plex Sans', sans-serif; border-radius: 6px; padding: 8px 16px; font-weight: 500; font-size: 14px;
             }}
             /* Scrollbars for TextEdit */
             QScrollBar:vertical {{
-                border: none; background: {self.COLORS['SURFACE']};
+                border: none; background: {c['SURFACE']};
                 width: 8px; margin: 0px;
                 border-radius: 4px;
             }}
             QScrollBar::handle:vertical {{
-                background: {self.COLORS['BORDER']};
+                background: {c['BORDER']};
                 min-height: 40px; border-radius: 4px;
             }}
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
                 height: 0px;
             }}
-        """)
+        """
+        cls._PROGRESS_CSS = f"""
+            QProgressBar {{
+                border: none; background-color: {c['SURFACE_SECONDARY']};
+                border-radius: 2px;
+            }}
+            QProgressBar::chunk {{
+                background-color: {c['PRIMARY']}; border-radius: 2px;
+            }}
+        """
+        cls._TABLE_CSS = f"""
+            QTableView {{
+                background-color: {c['BACKGROUND']};
+                border: 1px solid {c['BORDER']};
+                border-radius: 6px;
+                outline: none;
+                gridline-color: {c['BORDER']};
+            }}
+            QHeaderView::section {{
+                background-color: #F4F4F5;
+                padding: 8px;
+                border: none;
+                border-bottom: 1px solid {c['BORDER']};
+                font-weight: 600;
+                color: {c['TEXT_SECONDARY']};
+            }}
+            QTableView::item {{
+                padding: 8px;
+                border-bottom: 1px solid {c['BORDER']};
+            }}
+            QTableView::item:selected {{
+                background-color: {c['SURFACE_SECONDARY']};
+                color: {c['TEXT_PRIMARY']};
+            }}
+        """
+        cls._SECONDARY_BTN_CSS = f"""
+            QPushButton {{ background-color: {c['SURFACE']}; color: {c['TEXT_PRIMARY']}; border: 1px solid {c['BORDER']}; }}
+            QPushButton:hover {{ background-color: {c['SURFACE_SECONDARY']}; }}
+        """
+        cls._PRIMARY_BTN_CSS = f"""
+            QPushButton {{ background-color: {c['PRIMARY']}; color: {c['PRIMARY_FOREGROUND']}; border: 1px solid {c['PRIMARY']}; }}
+            QPushButton:hover {{ background-color: #27272A; }}
+            QPushButton:disabled {{ background-color: {c['SURFACE_SECONDARY']}; color: {c['TEXT_SECONDARY']}; border: 1px solid {c['BORDER']}; }}
+        """
+        cls._MENU_CSS = f"""
+            QMenu {{
+                font-family: 'IBM Plex Sans', sans-serif;
+                font-size: 14px;
+                background-color: {c['SURFACE']};
+                border: 1px solid {c['BORDER']};
+                border-radius: 6px;
+                padding: 4px;
+            }}
+            QMenu::item {{
+                padding: 6px 12px;
+                border-radius: 4px;
+                color: {c['TEXT_PRIMARY']};
+                font-size: 14px;
+            }}
+            QMenu::item:selected {{
+                background-color: {c['SURFACE_SECONDARY']};
+                color: {c['TEXT_PRIMARY']};
+            }}
+        """
+        cls._STYLES_BUILT = True
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"{APP_NAME} | Create Links")
+        self.setModal(True)
+        self.setFixedSize(900, 700)
+        
+        # Progreso del worker: solo se conserva el último mensaje y el
+        # título se actualiza como máximo cada 50 ms
+        self._progress_buf = deque(maxlen=1)
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._apply_progress)
+        
+        self.all_results = []
+        # Contadores de estados accionables (ver _recount_statuses)
+        self._ready = 0
+        self._update = 0
+        # Texto de la última verificación exitosa (None si ya no es válida)
+        self._last_verified_text = None
+        # True mientras el worker procesa una tarea (no se puede cerrar)
+        self._busy = False
+        
+        self._build_styles()
+        self.setStyleSheet(self._DIALOG_CSS)
         
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
@@ -177,7 +447,7 @@ class LinkCreationDialog(QDialog):
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("Create Zoom Links")
-        title.setStyleSheet(f"font-size: 18px; font-weight: 600; color: {self.COLORS['TEXT_PRIMARY']};")
+        title.setStyleSheet(self._TITLE_CSS)
         header_layout.addWidget(title)
         layout.addLayout(header_layout)
         
@@ -199,6 +469,7 @@ class LinkCreationDialog(QDialog):
         self.program_input = QTextEdit()
         self.program_input.setPlaceholderText("Paste list of programs here...")
         self.program_input.setMinimumHeight(150)
+        self.program_input.textChanged.connect(self._invalidate_verification)
         input_layout.addWidget(self.program_input)
         layout.addLayout(input_layout)
         
@@ -207,26 +478,26 @@ class LinkCreationDialog(QDialog):
         self.progress_bar.setVisible(False)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(4)
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: none; background-color: {self.COLORS['SURFACE_SECONDARY']};
-                border-radius: 2px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.COLORS['PRIMARY']}; border-radius: 2px;
-            }}
-        """)
+        self.progress_bar.setStyleSheet(self._PROGRESS_CSS)
         layout.addWidget(self.progress_bar)
 
         # Results Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Status", "Program", "Meeting ID", "Link"])
+        self.table = QTableView()
+        self.model = ResultsModel(self)
+        # La vista trabaja sobre el proxy: los índices de la tabla se
+        # traducen con mapToSource antes de tocar el modelo
+        self.proxy = ResultsProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        # Como antes: el orden solo cambia al hacer clic en la cabecera
+        self.proxy.setDynamicSortFilter(False)
+        self.table.setModel(self.proxy)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection) # Allow multi-select
         self.table.setShowGrid(False)
         self.table.setFrameShape(QFrame.Shape.NoFrame)
         self.table.setSortingEnabled(True)
+        # Sin columna de orden hasta el primer clic: se muestra el orden del worker
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.table.verticalHeader().setVisible(False)
         self.table.verticalHeader().setDefaultSectionSize(40)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
@@ -237,42 +508,32 @@ class LinkCreationDialog(QDialog):
         self.hover_delegate = RowHoverDelegate(self.table, self.COLORS['SURFACE_SECONDARY'])
         self.table.setItemDelegate(self.hover_delegate)
         self.table.setMouseTracking(True)
-        self.table.cellEntered.connect(self.on_cell_entered)
+        self.table.entered.connect(self.on_cell_entered)
 
-        self.table.setStyleSheet(f"""
-            QTableWidget {{
-                background-color: {self.COLORS['BACKGROUND']};
-                border: 1px solid {self.COLORS['BORDER']};
-                border-radius: 6px;
-                outline: none;
-                gridline-color: {self.COLORS['BORDER']};
-            }}
-            QHeaderView::section {{
-                background-color: #F4F4F5;
-                padding: 8px;
-                border: none;
-                border-bottom: 1px solid {self.COLORS['BORDER']};
-                font-weight: 600;
-                color: {self.COLORS['TEXT_SECONDARY']};
-            }}
-            QTableWidget::item {{
-                padding: 8px;
-                border-bottom: 1px solid {self.COLORS['BORDER']};
-            }}
-            QTableWidget::item:selected {{
-                background-color: {self.COLORS['SURFACE_SECONDARY']};
-                color: {self.COLORS['TEXT_PRIMARY']};
-            }}
-        """)
+        self.table.setStyleSheet(self._TABLE_CSS)
         
         self.table.setColumnWidth(0, 120) # Status
-        self.table.setColumnWidth(1, 350) # Program
+        self.table.setColumnWidth(1, self.PROGRAM_MIN_WIDTH) # Program
         self.table.setColumnWidth(2, 120) # Meeting ID
+        # Status y Meeting ID tienen contenido acotado: ancho fijo, sin medir filas
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
         
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
         
-        self.table.cellClicked.connect(self.on_cell_clicked)
+        # Menú contextual: se construye y estiliza una sola vez
+        self._ctx_menu = QMenu(self)
+        self._ctx_menu.setStyleSheet(self._MENU_CSS)
+        self._copy_action = self._ctx_menu.addAction("Copy Row")
+        self._copy_action.triggered.connect(self._copy_selected)
+        self._ctx_sep = self._ctx_menu.addSeparator()
+        self._deselect_action = self._ctx_menu.addAction("Deselect All")
+        self._deselect_action.triggered.connect(self.table.clearSelection)
+        
+        # Acción de clic por columna: Status alterna, Meeting ID / Link abren la URL
+        self._col_handlers = {0: self._toggle_status, 2: self._open_url, 3: self._open_url}
+        self.table.clicked.connect(self.on_cell_clicked)
         layout.addWidget(self.table)
         
         # Buttons
@@ -281,28 +542,18 @@ class LinkCreationDialog(QDialog):
         
         self.close_btn = QPushButton("Close")
         self.close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.close_btn.setStyleSheet(f"""
-            QPushButton {{ background-color: {self.COLORS['SURFACE']}; color: {self.COLORS['TEXT_PRIMARY']}; border: 1px solid {self.COLORS['BORDER']}; }}
-            QPushButton:hover {{ background-color: {self.COLORS['SURFACE_SECONDARY']}; }}
-        """)
+        self.close_btn.setStyleSheet(self._SECONDARY_BTN_CSS)
         self.close_btn.clicked.connect(self.accept)
         
         self.verify_btn = QPushButton("Verify")
         self.verify_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.verify_btn.setStyleSheet(f"""
-            QPushButton {{ background-color: {self.COLORS['SURFACE']}; color: {self.COLORS['TEXT_PRIMARY']}; border: 1px solid {self.COLORS['BORDER']}; }}
-            QPushButton:hover {{ background-color: {self.COLORS['SURFACE_SECONDARY']}; }}
-        """)
+        self.verify_btn.setStyleSheet(self._SECONDARY_BTN_CSS)
         self.verify_btn.clicked.connect(self.verify_links)
         
         self.create_btn = QPushButton("Create Links")
         self.create_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.create_btn.setEnabled(False) # Disabled until verified
-        self.create_btn.setStyleSheet(f"""
-            QPushButton {{ background-color: {self.COLORS['PRIMARY']}; color: {self.COLORS['PRIMARY_FOREGROUND']}; border: 1px solid {self.COLORS['PRIMARY']}; }}
-            QPushButton:hover {{ background-color: #27272A; }}
-            QPushButton:disabled {{ background-color: {self.COLORS['SURFACE_SECONDARY']}; color: {self.COLORS['TEXT_SECONDARY']}; border: 1px solid {self.COLORS['BORDER']}; }}
-        """)
+        self.create_btn.setStyleSheet(self._PRIMARY_BTN_CSS)
         self.create_btn.clicked.connect(self.create_links)
         
         btn_layout.addWidget(self.close_btn)
@@ -310,74 +561,73 @@ class LinkCreationDialog(QDialog):
         btn_layout.addWidget(self.verify_btn)
         btn_layout.addWidget(self.create_btn)
         layout.addLayout(btn_layout)
+        
+        # Un solo worker para todo el diálogo: verify/create se encolan en él
+        self.worker = LinkCreationWorker(self)
+        self.worker.progress.connect(self.update_progress)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.start()
+
+    def reject(self):
+        # Esc / cerrar ventana: ignorado mientras el worker trabaja
+        if self._busy:
+            return
+        super().reject()
 
-    def on_cell_entered(self, row, column):
-        self.hover_delegate.hover_row = row
-        self.table.viewport().update()
+    def done(self, result):
+        # Cerrar el diálogo (accept/reject) libera el hilo del worker
+        self.worker.stop()
+        self.worker.wait()
+        super().done(result)
 
-    def on_cell_clicked(self, row, column):
-        pass
+    def _set_busy(self, busy: bool):
+        """Bloquea cerrar y lanzar tareas mientras el worker procesa una."""
+        self._busy = busy
+        self.close_btn.setEnabled(not busy)
+        self.verify_btn.setEnabled(not busy)
+        self.program_input.setEnabled(not busy)
+        self.progress_bar.setVisible(busy)
+
+    def _invalidate_verification(self):
+        self._last_verified_text = None
+
+    def on_cell_entered(self, index):
+        self.hover_delegate.set_hover_row(index.row())
 
     def show_context_menu(self, position):
         """Muestra el menú contextual."""
-        menu = QMenu(self)
+        # Un índice por fila seleccionada (no uno por celda)
+        count = len(self.table.selectionModel().selectedRows())
         
-        # Estilo del menú (copiado de app_legacy.py para consistencia)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                font-family: 'IBM Plex Sans', sans-serif;
-                font-size: 14px;
-                background-color: {self.COLORS['SURFACE']};
-                border: 1px solid {self.COLORS['BORDER']};
-                border-radius: 6px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 6px 12px;
-                border-radius: 4px;
-                color: {self.COLORS['TEXT_PRIMARY']};
-                font-size: 14px;
-            }}
-            QMenu::item:selected {{
-                background-color: {self.COLORS['SURFACE_SECONDARY']};
-                color: {self.COLORS['TEXT_PRIMARY']};
-            }}
-        """)
+        if not count:
+            return
         
-        # Get selected items
-        selected_rows = sorted(set(index.row() for index in self.table.selectedIndexes()))
+        # Solo se ajustan texto y visibilidad de las acciones existentes
+        multiple = count > 1
+        self._copy_action.setText(f"Copy {count} selected Rows" if multiple else "Copy Row")
+        self._ctx_sep.setVisible(multiple)
+        self._deselect_action.setVisible(multiple)
         
-        if not selected_rows:
-            return
-            
-        # Copy Rows
-        if len(selected_rows) > 1:
-            copy_rows_action = menu.addAction(f"Copy {len(selected_rows)} selected Rows")
-            copy_rows_action.triggered.connect(self.copy_selected_rows)
-            
-            menu.addSeparator()
-            
-            deselect_action = menu.addAction("Deselect All")
-            deselect_action.triggered.connect(self.table.clearSelection)
-        else:
-            copy_row_action = menu.addAction("Copy Row")
-            copy_row_action.triggered.connect(lambda: self.copy_single_row(selected_rows[0]))
-            
-        menu.exec(self.table.viewport().mapToGlobal(position))
+        self._ctx_menu.exec(self.table.viewport().mapToGlobal(position))
+
+    def _copy_selected(self):
+        """Acción de copiar del menú contextual."""
+        selected = self.table.selectionModel().selectedRows()
+        if len(selected) == 1:
+            self.copy_single_row(self.proxy.mapToSource(selected[0]).row())
+        elif selected:
+            self.copy_selected_rows()
 
     def copy_selected_rows(self):
         """Copia las filas seleccionadas al portapapeles."""
-        selected_rows = sorted(set(index.row() for index in self.table.selectedIndexes()))
-        blocks = []
-        for row in selected_rows:
-            program_item = self.table.item(row, 1)
-            program = program_item.text() if program_item else ""
-            
-            link_item = self.table.item(row, 3)
-            link = link_item.text() if link_item else ""
-            
-            blocks.append(f"{program}\n{link}")
-        
+        # Filas del modelo en el orden en que se ven en la tabla
+        selected = sorted(self.table.selectionModel().selectedRows(), key=lambda idx: idx.row())
+        selected_rows = [self.proxy.mapToSource(idx).row() for idx in selected]
+        text = self.model.text
+        # Lista de tamaño fijo y concatenación simple: un solo join al final
+        blocks = [None] * len(selected_rows)
+        for i, row in enumerate(selected_rows):
+            blocks[i] = text(row, 1) + "\n" + text(row, 3)
         QApplication.clipboard().setText("\n\n".join(blocks))
         
         # Show status instead of popup
@@ -385,11 +635,8 @@ class LinkCreationDialog(QDialog):
 
     def copy_single_row(self, row):
         """Copia una sola fila."""
-        program_item = self.table.item(row, 1)
-        program = program_item.text() if program_item else ""
-        
-        link_item = self.table.item(row, 3)
-        link = link_item.text() if link_item else ""
+        program = self.model.text(row, 1)
+        link = self.model.text(row, 3)
         
         QApplication.clipboard().setText(f"{program}\n{link}")
         
@@ -398,102 +645,73 @@ class LinkCreationDialog(QDialog):
 
     def verify_links(self):
         """Inicia el proceso de verificación."""
+        # El parseo línea a línea lo hace el worker
         text = self.program_input.toPlainText()
-        programs = [line.strip() for line in text.split('\n') if line.strip()]
         
-        if not programs:
+        if not text.strip():
             custom_message_box(
                 self, "Warning", "Please enter at least one program.",
                 QMessageBox.Icon.Warning, QMessageBox.StandardButton.Ok
             )
             return
+        
+        # Mismo texto que la última verificación: reutilizar los resultados
+        if text == self._last_verified_text:
+            self.populate_table(self.all_results)
+            return
             
-        self.verify_btn.setEnabled(False)
+        self._set_busy(True)
         self.create_btn.setEnabled(False)
-        self.program_input.setEnabled(False)
-        self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
-        self.table.setRowCount(0)
+        self.model.set_rows([])
         
-        self.worker = LinkCreationWorker(programs, mode="verify")
-        self.worker.progress.connect(self.update_progress)
-        self.worker.finished.connect(self.on_finished)
-        self.worker.start()
+        self.worker.submit(text, mode="verify")
 
     def create_links(self):
         """Inicia el proceso de creación/actualización para los items marcados."""
-        # Get current table data with status
-        items_to_process = []
-        for i in range(self.table.rowCount()):
-            status_item = self.table.item(i, 0)
-            program_item = self.table.item(i, 1)
-            meeting_id_item = self.table.item(i, 2)
-            link_item = self.table.item(i, 3)
-            
-            if status_item and program_item:
-                status_text = status_item.text().lower().replace(" ", "_")
-                # Convert UI status to internal status
-                if status_text == "to_create":
-                    status_text = "ready"
-                elif status_text == "to_update":
-                    status_text = "to_update"
-                else:
-                    status_text = status_item.text().lower()
-                
-                items_to_process.append({
-                    "program": program_item.text(),
-                    "status": status_text,
-                    "meeting_id": meeting_id_item.text() if meeting_id_item else "-",
-                    "join_url": link_item.data(Qt.ItemDataRole.UserRole) if link_item else ""
-                })
-        
-        # Check if there's anything to process
-        actionable = [i for i in items_to_process if i["status"] in ["ready", "to_update"]]
-        if not actionable:
+        # Los resultados del verify ya reflejan los cambios de estado hechos
+        # con clic (el modelo comparte all_results); el worker recibe una
+        # copia para que la tabla siga editable sin compartir los dicts
+        if not any(r["status"] in ("ready", "to_update") for r in self.all_results):
             return
 
-        self.verify_btn.setEnabled(False)
+        self._set_busy(True)
         self.create_btn.setEnabled(False)
-        self.program_input.setEnabled(False)
-        self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
         
-        self.worker = LinkCreationWorker(items_to_process, mode="create")
-        self.worker.progress.connect(self.update_progress)
-        self.worker.finished.connect(self.on_finished)
-        self.worker.start()
+        self.worker.submit([dict(r) for r in self.all_results], mode="create")
 
     def update_progress(self, msg):
-        self.setWindowTitle(f"{APP_NAME} | {msg}")
+        self._progress_buf.append(msg)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
 
-    def on_finished(self, results, errors, mode):
-        self.verify_btn.setEnabled(True)
-        self.program_input.setEnabled(True)
-        self.progress_bar.setVisible(False)
+    def _apply_progress(self):
+        """Muestra el último mensaje de progreso recibido."""
+        if self._progress_buf:
+            self.setWindowTitle(f"{APP_NAME} | {self._progress_buf.pop()}")
+
+    def on_finished(self, results, errors, mode, items, removed):
+        self._set_busy(False)
+        # Descartar el progreso pendiente antes de restaurar el título
+        self._progress_timer.stop()
+        self._progress_buf.clear()
         self.setWindowTitle(f"{APP_NAME} | Create Links")
         
         if mode == "verify":
+            # populate_table ya cuenta los estados y actualiza el botón
             self.all_results = results
             self.populate_table(self.all_results)
+            self._last_verified_text = None if errors else items
             
-            # Check if any ready to create or update
-            ready_count = sum(1 for r in results if r["status"] == "ready")
-            existing_count = sum(1 for r in results if r["status"] == "existing")
-            
-            if ready_count > 0 or existing_count > 0:
-                self.create_btn.setEnabled(True)
-                btn_text = []
-                if ready_count > 0:
-                    btn_text.append(f"Create ({ready_count})")
-                self.create_btn.setText(" / ".join(btn_text) if btn_text else "Process")
-            else:
-                self.create_btn.setEnabled(False)
-                self.create_btn.setText("Create Links")
+            self.status_label.setText(f"Removed {removed} duplicates" if removed else "")
                 
         elif mode == "create":
-            # Update all_results with new results
-            self.all_results = results
-            self.populate_table(self.all_results)
+            # Solo cambian las filas procesadas: se actualizan en sitio
+            # (el modelo comparte la lista all_results)
+            self.model.update_rows(results)
+            self._last_verified_text = None  # Los estados ya no son los verificados
+            self._recount_statuses()
             self.create_btn.setEnabled(False)
             self.create_btn.setText("Create Links")
             
@@ -519,78 +737,35 @@ class LinkCreationDialog(QDialog):
                 )
 
     def populate_table(self, results):
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(len(results))
-        
-        for i, res in enumerate(results):
-            # Status (Column 0)
-            status = res["status"]
-            status_item = QTableWidgetItem()
-            
-            # Map status to display text and color
-            status_config = {
-                "ready": ("To Create", "#16a34a"),      # Green
-                "existing": ("Existing", "#71717a"),    # Gray
-                "to_update": ("To Update", "#2563eb"),  # Blue
-                "created": ("Created", "#16a34a"),      # Green
-                "updated": ("Updated", "#2563eb"),      # Blue
-                "error": ("Error", "#dc2626"),          # Red
-            }
-            
-            display_text, color = status_config.get(status, (status.title(), "#71717a"))
-            status_item.setText(display_text)
-            status_item.setForeground(QColor(color))
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            # Store original status for processing
-            status_item.setData(Qt.ItemDataRole.UserRole, status)
-            self.table.setItem(i, 0, status_item)
-
-            # Program (Column 1)
-            prog_item = QTableWidgetItem(res["program"])
-            prog_item.setFlags(prog_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(i, 1, prog_item)
-            
-            # Meeting ID (Column 2) - Clickable link
-            meeting_id = res["meeting_id"]
-            id_item = QTableWidgetItem(meeting_id)
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if meeting_id and meeting_id != "-":
-                id_item.setForeground(QColor("#2563EB"))
-                font = id_item.font()
-                font.setUnderline(True)
-                id_item.setFont(font)
-                # Store zoom meeting URL for click handling
-                id_item.setData(Qt.ItemDataRole.UserRole, f"https://zoom.us/meeting/{meeting_id}")
-            self.table.setItem(i, 2, id_item)
-            
-            # Link (Column 3)
-            link = res.get("join_url", "")
-            link_item = QTableWidgetItem(link)
-            if link and link != "-":
-                link_item.setForeground(QColor("#2563EB"))
-                font = link_item.font()
-                font.setUnderline(True)
-                link_item.setFont(font)
-                link_item.setData(Qt.ItemDataRole.UserRole, link)
-            
-            self.table.setItem(i, 3, link_item)
-            
-        self.table.setSortingEnabled(True)
+        # Reset y reajuste de la cabecera se pintan una sola vez al final
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_rows(results)
+            self._fit_program_column()
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self._recount_statuses()
         self._update_create_button()
     
+    def _fit_program_column(self):
+        """Ajusta el ancho de Program a las primeras filas (sin recorrer todo el modelo)."""
+        sample = range(min(self.model.rowCount(), self.WIDTH_SAMPLE_ROWS))
+        longest = max((self.model.text(row, 1) for row in sample), key=len, default="")
+        width = self.table.fontMetrics().horizontalAdvance(longest) + 32  # padding de celda
+        self.table.setColumnWidth(
+            1, min(max(width, self.PROGRAM_MIN_WIDTH), self.PROGRAM_MAX_WIDTH)
+        )
+
+    def _recount_statuses(self):
+        """Cuenta una sola vez los resultados listos para crear o actualizar."""
+        counts = Counter(r["status"] for r in self.all_results)
+        self._ready = counts["ready"]
+        self._update = counts["to_update"]
+    
     def _update_create_button(self):
         """Update create button text based on current table state."""
-        ready_count = 0
-        update_count = 0
-        
-        for i in range(self.table.rowCount()):
-            status_item = self.table.item(i, 0)
-            if status_item:
-                status = status_item.data(Qt.ItemDataRole.UserRole)
-                if status == "ready":
-                    ready_count += 1
-                elif status == "to_update":
-                    update_count += 1
+        ready_count = self._ready
+        update_count = self._update
         
         if ready_count > 0 or update_count > 0:
             self.create_btn.setEnabled(True)
@@ -604,26 +779,29 @@ class LinkCreationDialog(QDialog):
             self.create_btn.setEnabled(False)
             self.create_btn.setText("Create Links")
 
-    def on_cell_clicked(self, row, column):
-        if column == 0:  # Status column - toggle
-            item = self.table.item(row, column)
-            if item:
-                current_status = item.data(Qt.ItemDataRole.UserRole)
-                # Toggle between existing <-> to_update
-                if current_status == "existing":
-                    item.setText("To Update")
-                    item.setForeground(QColor("#2563eb"))
-                    item.setData(Qt.ItemDataRole.UserRole, "to_update")
-                    self._update_create_button()
-                elif current_status == "to_update":
-                    item.setText("Existing")
-                    item.setForeground(QColor("#71717a"))
-                    item.setData(Qt.ItemDataRole.UserRole, "existing")
-                    self._update_create_button()
-                    
-        elif column in [2, 3]:  # Meeting ID or Link column
-            item = self.table.item(row, column)
-            if item:
-                url = item.data(Qt.ItemDataRole.UserRole)
-                if url:
-                    QDesktopServices.openUrl(QUrl(url))
+    def on_cell_clicked(self, index):
+        handler = self._col_handlers.get(index.column())
+        if handler:
+            handler(index)
+
+    def _toggle_status(self, index):
+        """Alterna existing <-> to_update en la columna Status."""
+        current_status = index.data(Qt.ItemDataRole.UserRole)
+        # El cambio es de un solo estado: ajustar el contador en O(1)
+        if current_status == "existing":
+            self.model.setData(self.proxy.mapToSource(index), "to_update")
+            self._update += 1
+            self._update_create_button()
+        elif current_status == "to_update":
+            self.model.setData(self.proxy.mapToSource(index), "existing")
+            self._update -= 1
+            self._update_create_button()
+
+    def _open_url(self, index):
+        """Abre la URL de las columnas Meeting ID / Link, si la fila tiene una."""
+        value = index.data(Qt.ItemDataRole.UserRole)
+        if not value:
+            return
+        if index.column() == 2:
+            value = f"https://zoom.us/meeting/{value}"
+        QDesktopServices.openUrl(QUrl(value))
@@ -11,13 +11,15 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QIcon
 
-from supabase import Client
-from typing import Optional, Dict
+from typing import TYPE_CHECKING, Optional, Dict
 
 from app.services.auth_service import auth_service
 from app.services.session_service import session_service
 from app.config import config
 
+if TYPE_CHECKING:
+    from supabase import Client  # Type-only: supabase loads on first login
+
 
 class LoginWorker(QThread):
     """Worker thread for authentication"""
@@ -42,7 +44,7 @@ class LoginDialog(QDialog):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.supabase_client: Optional[Client] = None
+        self.supabase_client: Optional['Client'] = None
         self.user_info: Dict = {}
         self._login_worker: Optional[LoginWorker] = None
         
@@ -253,7 +255,7 @@ class LoginDialog(QDialog):
         self._login_worker.error.connect(self._on_login_error)
         self._login_worker.start()
     
-    def _on_login_success(self, supabase: Client, user_info: Dict):
+    def _on_login_success(self, supabase: 'Client', user_info: Dict):
         self.supabase_client = supabase
         self.user_info = user_info
         
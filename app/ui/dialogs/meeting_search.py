@@ -15,7 +15,7 @@ from PyQt6.QtGui import QColor, QDesktopServices
 
 from theme_manager import theme
 from app.ui.delegates import RowHoverDelegate
-from app.workers import MeetingSearchWorker
+from app.workers import WORKER_POOL, MeetingSearchWorker
 
 
 APP_NAME = "Chronos"
@@ -186,12 +186,11 @@ class MeetingSearchDialog(QDialog):
         QTimer.singleShot(100, self.load_data)
 
     def on_cell_entered(self, row, column):
-        self.hover_delegate.hover_row = row
+        self.hover_delegate.set_hover_row(row)
         if column == 0:
             self.table.setCursor(Qt.CursorShape.PointingHandCursor)
         else:
             self.table.setCursor(Qt.CursorShape.ArrowCursor)
-        self.table.viewport().update()
 
     def on_cell_clicked(self, row, column):
         if column == 0:
@@ -210,7 +209,7 @@ class MeetingSearchDialog(QDialog):
         self.worker = MeetingSearchWorker()
         self.worker.progress.connect(self.update_progress)
         self.worker.finished.connect(self.on_data_loaded)
-        self.worker.start()
+        WORKER_POOL.start(self.worker)
         
     def update_progress(self, msg):
         self.setWindowTitle(f"{APP_NAME} | Search Meetings - {msg}")
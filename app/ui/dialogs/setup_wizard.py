@@ -5,64 +5,222 @@ Uses default Qt styling.
 """
 
 import os
+import html
+import math
+import logging
 from PyQt6.QtWidgets import (
     QWizard, QWizardPage, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QMessageBox
+    QLabel, QLineEdit, QPushButton, QMessageBox, QWidget, QSizePolicy
 )
-from PyQt6.QtCore import QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon
-
-from supabase import create_client
-import webbrowser
+from PyQt6.QtCore import Qt, QObject, QRunnable, QSize, QThread, QThreadPool, pyqtSignal, QTimer
+from PyQt6.QtGui import QIcon, QColor, QPainter, QStaticText
 
+from app import cache
 from app.config import config
+from app.http import get_http_client, get_supabase
+
+logger = logging.getLogger(__name__)
+
+
+# Static page texts
+WELCOME_TEXT = (
+    "Setup includes:\n\n"
+    "1. Connect to Supabase\n"
+    "2. Sign in or create account\n"
+    "3. Connect Zoom (optional)\n\n"
+    "You'll need:\n"
+    "- Supabase Project URL and Anon Key\n"
+    "- Zoom OAuth configured in your Supabase Edge Functions"
+)
+
+ZOOM_ADMIN_TEXT = (
+    "Before connecting, make sure you have:\n\n"
+    "1. Created a Zoom OAuth App in Zoom Marketplace\n"
+    "2. Set the Redirect URI to:\n"
+    "   {your-supabase-url}/functions/v1/zoom-oauth\n"
+    "3. Added ZOOM_CLIENT_ID and ZOOM_CLIENT_SECRET\n"
+    "   to your Supabase Edge Function secrets"
+)
+
+ZOOM_NON_ADMIN_TEXT = (
+    "Only administrators can connect Zoom.\n\n"
+    "Zoom is configured at the organization level.\n"
+    "Contact your administrator to set up Zoom integration."
+)
+
+
+class StatusLabel(QLabel):
+    """Status line that skips updates when the text has not changed"""
+    
+    def __init__(self, text: str = ""):
+        super().__init__(text)
+        self._last_status = text
+    
+    def setText(self, text: str):
+        if text != self._last_status:
+            self._last_status = text
+            super().setText(text)
+
+
+class StaticInfoLabel(QWidget):
+    """Fixed multi-line text laid out once (QStaticText) instead of on every resize"""
+    
+    def __init__(self, text: str, color: str = None, padding: int = 0):
+        super().__init__()
+        # QStaticText ignores "\n" in plain text: keep line breaks and indents as preformatted rich text
+        self._text = QStaticText(f'<div style="white-space: pre">{html.escape(text)}</div>')
+        self._text.setTextFormat(Qt.TextFormat.RichText)
+        self._color = QColor(color) if color else None
+        self.setContentsMargins(0, padding, 0, padding)
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+    
+    def sizeHint(self) -> QSize:
+        self._text.prepare(font=self.font())
+        margins = self.contentsMargins()
+        size = self._text.size()
+        return QSize(math.ceil(size.width()) + margins.left() + margins.right(),
+                     math.ceil(size.height()) + margins.top() + margins.bottom())
+    
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+    
+    def changeEvent(self, event):
+        if event.type() == event.Type.FontChange:
+            self.updateGeometry()
+        super().changeEvent(event)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setPen(self._color or self.palette().windowText().color())
+        margins = self.contentsMargins()
+        painter.drawStaticText(margins.left(), margins.top(), self._text)
 
 
-class ConnectionTestWorker(QThread):
-    """Test Supabase connection in background"""
+class _WorkerSignals(QObject):
+    """Signals for pooled workers (QRunnable is not a QObject)"""
     finished = pyqtSignal(bool, str)
+
+
+class ConnectionTestWorker(QRunnable):
+    """Test Supabase connection in background (runs on the wizard's thread pool)"""
     
     def __init__(self, url: str, key: str):
         super().__init__()
+        self.signals = _WorkerSignals()
         self.url = url
         self.key = key
     
     def run(self):
         try:
-            client = create_client(self.url, self.key)
-            client.table("roles").select("name").limit(1).execute()
-            self.finished.emit(True, "Connection successful!")
+            # The API gateway validates URL + anon key; no table query needed
+            response = get_http_client().get(
+                f"{self.url}/auth/v1/settings",
+                headers={"apikey": self.key, "Authorization": f"Bearer {self.key}"}
+            )
+            if response.status_code < 400:
+                self.signals.finished.emit(True, "Connection successful!")
+            elif response.status_code in (401, 403):
+                self.signals.finished.emit(False, "Invalid anon key")
+            else:
+                self.signals.finished.emit(False, f"HTTP {response.status_code}")
         except Exception as e:
-            self.finished.emit(False, str(e))
+            self.signals.finished.emit(False, str(e))
 
 
-class ZoomStatusWorker(QThread):
-    """Check Zoom OAuth status"""
-    finished = pyqtSignal(bool, str)
+class ZoomStatusWorker(QRunnable):
+    """Check Zoom OAuth status (reusable: call trigger() for each check)"""
     
     def __init__(self, url: str, key: str):
         super().__init__()
+        # Kept alive by its page so the same runnable serves every check
+        self.setAutoDelete(False)
+        self.signals = _WorkerSignals()
         self.url = url
         self.key = key
+        self._busy = False
+        # Built once, reused by every poll
+        self._status_url = f"{url}/functions/v1/zoom-oauth?action=status"
+        self._headers = {"apikey": key}
+    
+    def trigger(self, pool: QThreadPool):
+        """Queue a status check on `pool` (ignored while one is running)"""
+        if self._busy:
+            return
+        self._busy = True
+        pool.start(self)
     
     def run(self):
+        connected, msg = self._check()
+        self._busy = False
+        self.signals.finished.emit(connected, msg)
+    
+    def _check(self):
         try:
-            import httpx
-            response = httpx.get(
-                f"{self.url}/functions/v1/zoom-oauth?action=status",
-                headers={"apikey": self.key},
-                timeout=10.0
-            )
+            response = get_http_client().get(self._status_url, headers=self._headers)
             if response.status_code == 200:
                 data = response.json()
                 if data.get("configured"):
-                    self.finished.emit(True, f"Connected (updated: {data.get('updated_at', 'N/A')})")
+                    return True, f"Connected (updated: {data.get('updated_at', 'N/A')})"
+                return False, "Not configured"
+            return False, "Could not check status"
+        except Exception as e:
+            return False, str(e)
+
+
+class _AuthorizeSignals(QObject):
+    """Signals for ZoomAuthorizeWorker"""
+    # access_token, authorization_url, error message ("" when not applicable)
+    finished = pyqtSignal(str, str, str)
+
+
+class ZoomAuthorizeWorker(QRunnable):
+    """Sign in (unless a token is given) and request the Zoom authorization URL"""
+    
+    def __init__(self, url: str, key: str, email: str, password: str, access_token: str = ""):
+        super().__init__()
+        self.signals = _AuthorizeSignals()
+        self.url = url
+        self.key = key
+        self.email = email
+        self.password = password
+        self.access_token = access_token
+    
+    def run(self):
+        access_token = self.access_token
+        try:
+            if not access_token:
+                client = get_supabase(self.url, self.key)
+                auth_resp = client.auth.sign_in_with_password({
+                    "email": self.email,
+                    "password": self.password
+                })
+                
+                if not auth_resp.session:
+                    self.signals.finished.emit("", "", "Could not authenticate.")
+                    return
+                
+                access_token = auth_resp.session.access_token
+            
+            response = get_http_client().get(
+                f"{self.url}/functions/v1/zoom-oauth?action=authorize",
+                headers={
+                    "apikey": self.key,
+                    "Authorization": f"Bearer {access_token}"
+                }
+            )
+            
+            if response.status_code == 200:
+                auth_url = response.json().get("authorization_url")
+                if auth_url:
+                    self.signals.finished.emit(access_token, auth_url, "")
                 else:
-                    self.finished.emit(False, "Not configured")
+                    self.signals.finished.emit(access_token, "", "No authorization URL received")
             else:
-                self.finished.emit(False, "Could not check status")
+                error = response.json().get("error", "Unknown error")
+                self.signals.finished.emit(access_token, "", f"Error: {error}")
+                
         except Exception as e:
-            self.finished.emit(False, str(e))
+            self.signals.finished.emit(access_token, "", f"Error: {str(e)[:50]}")
 
 
 class ZoomAdminCheckWorker(QThread):
@@ -79,11 +237,8 @@ class ZoomAdminCheckWorker(QThread):
     
     def run(self):
         try:
-            import httpx
-            from supabase import create_client
-            
             # Authenticate user
-            client = create_client(self.url, self.key)
+            client = get_supabase(self.url, self.key)
             auth_resp = client.auth.sign_in_with_password({
                 "email": self.email,
                 "password": self.password
@@ -100,10 +255,9 @@ class ZoomAdminCheckWorker(QThread):
             is_admin = role_resp.data.get("role") == "admin" if role_resp.data else False
             
             # Check Zoom status
-            zoom_response = httpx.get(
+            zoom_response = get_http_client().get(
                 f"{self.url}/functions/v1/zoom-oauth?action=status",
-                headers={"apikey": self.key},
-                timeout=10.0
+                headers={"apikey": self.key}
             )
             
             zoom_connected = False
@@ -130,17 +284,7 @@ class WelcomePage(QWizardPage):
         
         layout = QVBoxLayout()
         
-        info = QLabel(
-            "Setup includes:\n\n"
-            "1. Connect to Supabase\n"
-            "2. Sign in or create account\n"
-            "3. Connect Zoom (optional)\n\n"
-            "You'll need:\n"
-            "- Supabase Project URL and Anon Key\n"
-            "- Zoom OAuth configured in your Supabase Edge Functions"
-        )
-        info.setWordWrap(True)
-        layout.addWidget(info)
+        layout.addWidget(StaticInfoLabel(WELCOME_TEXT))
         
         layout.addStretch()
         self.setLayout(layout)
@@ -173,7 +317,7 @@ class SupabasePage(QWizardPage):
         btn_layout = QHBoxLayout()
         self.test_btn = QPushButton("Test Connection")
         self.test_btn.clicked.connect(self._test)
-        self.status_lbl = QLabel("")
+        self.status_lbl = StatusLabel()
         btn_layout.addWidget(self.test_btn)
         btn_layout.addWidget(self.status_lbl)
         btn_layout.addStretch()
@@ -184,11 +328,26 @@ class SupabasePage(QWizardPage):
         
         self.registerField("supabase_url*", self.url_input)
         self.registerField("supabase_key*", self.key_input)
+        
+        # Prefill the last connection that passed; skip the test if it did so recently
+        self._tested = None
+        last = cache.get_last_connection()
+        if last:
+            url, key = last
+            self.url_input.setText(url)
+            self.key_input.setText(key)
+            if cache.is_fresh(url):
+                self.connection_tested = True
+                self.status_lbl.setText("Connected!")
     
     def _on_change(self):
+        # isComplete() only changes when a tested connection is invalidated;
+        # emitting on every keystroke made the wizard re-evaluate Next per character
+        was_tested = self.connection_tested
         self.connection_tested = False
         self.status_lbl.setText("")
-        self.completeChanged.emit()
+        if was_tested:
+            self.completeChanged.emit()
     
     def _test(self):
         url = self.url_input.text().strip()
@@ -200,23 +359,94 @@ class SupabasePage(QWizardPage):
         self.test_btn.setEnabled(False)
         self.status_lbl.setText("Testing...")
         
-        self.worker = ConnectionTestWorker(url, key)
-        self.worker.finished.connect(self._on_result)
-        self.worker.start()
+        self._tested = (url, key)
+        worker = ConnectionTestWorker(url, key)
+        worker.signals.finished.connect(self._on_result)
+        self.wizard().pool.start(worker)
     
     def _on_result(self, success, msg):
         self.test_btn.setEnabled(True)
         if success:
             self.status_lbl.setText("Connected!")
             self.connection_tested = True
+            cache.save_validated(*self._tested)
         else:
             self.status_lbl.setText(f"Error: {msg[:40]}...")
+            cache.clear_validated()
         self.completeChanged.emit()
     
     def isComplete(self):
         return self.connection_tested
 
 
+class _AccountSignals(QObject):
+    """Signals for AccountWorker"""
+    # outcome ("signed_in", "created", "mismatch", "wrong", "error"),
+    # auth response (None unless signed in/created), role or error message
+    finished = pyqtSignal(str, object, str)
+
+
+class AccountWorker(QRunnable):
+    """Sign in, or create the account if it doesn't exist yet, and save config"""
+    
+    def __init__(self, url: str, key: str, email: str, password: str, confirmed: bool):
+        super().__init__()
+        self.signals = _AccountSignals()
+        self.url = url
+        self.key = key
+        self.email = email
+        self.password = password
+        self.confirmed = confirmed  # Confirm password matches (checked for new accounts only)
+    
+    def run(self):
+        try:
+            client = get_supabase(self.url, self.key)
+            credentials = {"email": self.email, "password": self.password}
+            
+            # Try sign in first (handles case where user exists)
+            try:
+                auth_resp = client.auth.sign_in_with_password(credentials)
+            except Exception as sign_in_error:
+                # Only create new user if credentials are invalid (user doesn't exist)
+                if not AdminPage._is_invalid_credentials(sign_in_error):
+                    self.signals.finished.emit("wrong", None, "")
+                    return
+                if not self.confirmed:
+                    self.signals.finished.emit("mismatch", None, "")
+                    return
+                
+                auth_resp = client.auth.sign_up(credentials)
+                if not auth_resp.user:
+                    raise Exception("Failed to create user")
+                # New user gets role from trigger (first user = admin)
+                role = self._get_role(client, auth_resp.user.id, default="admin")
+                self._save_config()
+                self.signals.finished.emit("created", auth_resp, role)
+                return
+            
+            if not auth_resp.user:
+                raise Exception("Auth failed")
+            role = self._get_role(client, auth_resp.user.id, default="user")
+            self._save_config()
+            self.signals.finished.emit("signed_in", auth_resp, role)
+            
+        except Exception as e:
+            self.signals.finished.emit("error", None, str(e))
+    
+    @staticmethod
+    def _get_role(client, user_id: str, default: str) -> str:
+        try:
+            role_resp = client.table("user_profiles").select("role").eq("user_id", user_id).single().execute()
+            return role_resp.data.get("role", "user") if role_resp.data else "user"
+        except Exception:
+            return default
+    
+    def _save_config(self):
+        # Save config now that user is authenticated
+        config.save(self.url, self.key)
+        config.save_email(self.email)
+
+
 class AdminPage(QWizardPage):
     """Account page - sign in or create account"""
     
@@ -227,6 +457,7 @@ class AdminPage(QWizardPage):
         
         self.user_created = False
         self.user_role = "user"  # Default role
+        self._checking = False
         
         layout = QVBoxLayout()
         
@@ -246,7 +477,7 @@ class AdminPage(QWizardPage):
         self.confirm_input.setEchoMode(QLineEdit.EchoMode.Password)
         layout.addWidget(self.confirm_input)
         
-        self.status_lbl = QLabel("")
+        self.status_lbl = StatusLabel()
         layout.addWidget(self.status_lbl)
         
         layout.addStretch()
@@ -256,89 +487,82 @@ class AdminPage(QWizardPage):
         self.registerField("admin_password*", self.pass_input)
     
     def validatePage(self):
+        if self.user_created:
+            return True
+        
         if len(self.pass_input.text()) < 6:
             QMessageBox.warning(self, "Error", "Password must be at least 6 characters.")
             return False
         
-        if not self.user_created:
-            try:
-                url = self.field("supabase_url")
-                key = self.field("supabase_key")
-                email = self.email_input.text().strip()
-                password = self.pass_input.text()
-                
-                client = create_client(url, key)
-                
-                # Try sign in first (handles case where user exists)
-                self.status_lbl.setText("Checking account...")
-                try:
-                    auth_resp = client.auth.sign_in_with_password({
-                        "email": email,
-                        "password": password
-                    })
-                    if auth_resp.user:
-                        self.user_created = True
-                        self.status_lbl.setText("Signed in!")
-                        # Save config now that user is authenticated
-                        config.save(url, key)
-                        config.save_email(email)
-                        # Get user role
-                        try:
-                            role_resp = client.table("user_profiles").select("role").eq("user_id", auth_resp.user.id).single().execute()
-                            self.user_role = role_resp.data.get("role", "user") if role_resp.data else "user"
-                        except:
-                            self.user_role = "user"
-                        print(f"User signed in: {email} (role: {self.user_role})")
-                        return True
-                except Exception as sign_in_error:
-                    error_str = str(sign_in_error).lower()
-                    
-                    # Only create new user if credentials are invalid (user doesn't exist)
-                    if "invalid login credentials" in error_str:
-                        # Validate confirm password ONLY for new accounts
-                        if self.pass_input.text() != self.confirm_input.text():
-                            QMessageBox.warning(self, "Error", "Passwords do not match.")
-                            return False
-                        
-                        # User doesn't exist, create new account
-                        self.status_lbl.setText("Creating account...")
-                        auth_resp = client.auth.sign_up({
-                            "email": email,
-                            "password": password
-                        })
-                        
-                        if auth_resp.user:
-                            self.user_created = True
-                            self.status_lbl.setText("Account created!")
-                            # Save config now that user is created
-                            config.save(url, key)
-                            config.save_email(email)
-                            # New user gets role from trigger (first user = admin)
-                            try:
-                                role_resp = client.table("user_profiles").select("role").eq("user_id", auth_resp.user.id).single().execute()
-                                self.user_role = role_resp.data.get("role", "user") if role_resp.data else "user"
-                            except:
-                                self.user_role = "admin"  # First user is admin
-                            print(f"New user created: {email} (role: {self.user_role})")
-                            return True
-                        else:
-                            raise Exception("Failed to create user")
-                    else:
-                        # Wrong password or other error
-                        self.status_lbl.setText("Wrong password or account issue")
-                        return False
-                    
-            except Exception as e:
-                error_msg = str(e)
-                self.status_lbl.setText(f"Error: {error_msg[:50]}")
-                return False
-        
-        return True
+        if self._checking:
+            return False
+        
+        # Auth round-trips and config writes run on the pool; the wizard
+        # advances from _on_account_result once the account is ready
+        password = self.pass_input.text()
+        worker = AccountWorker(
+            self.field("supabase_url"), self.field("supabase_key"),
+            self.email_input.text().strip(), password,
+            confirmed=password == self.confirm_input.text()
+        )
+        worker.signals.finished.connect(self._on_account_result)
+        self._set_checking(True)
+        self.status_lbl.setText("Checking account...")
+        self.wizard().pool.start(worker)
+        return False
+    
+    def _set_checking(self, checking: bool):
+        self._checking = checking
+        for widget in (self.email_input, self.pass_input, self.confirm_input):
+            widget.setEnabled(not checking)
+    
+    def _on_account_result(self, outcome, auth_resp, detail):
+        self._set_checking(False)
+        
+        if outcome in ("signed_in", "created"):
+            self.user_created = True
+            self.user_role = detail
+            self._keep_session(auth_resp)
+            if outcome == "signed_in":
+                self.status_lbl.setText("Signed in!")
+                logger.info("User signed in: %s (role: %s)", auth_resp.user.email, detail)
+            else:
+                self.status_lbl.setText("Account created!")
+                logger.info("New user created: %s (role: %s)", auth_resp.user.email, detail)
+            # Advance only if the user is still on this page
+            if self.wizard().currentPage() is self:
+                self.wizard().next()
+        elif outcome == "mismatch":
+            # Validate confirm password ONLY for new accounts
+            self.status_lbl.setText("")
+            QMessageBox.warning(self, "Error", "Passwords do not match.")
+        elif outcome == "wrong":
+            self.status_lbl.setText("Wrong password or account issue")
+        else:
+            self.status_lbl.setText(f"Error: {detail[:50]}")
+    
+    def _keep_session(self, auth_resp):
+        """Share the authenticated session so later pages don't sign in again"""
+        self.wizard().session = auth_resp.session  # None if sign-up awaits email confirmation
+        self.wizard().user_id = auth_resp.user.id
+    
+    @staticmethod
+    def _is_invalid_credentials(error: Exception) -> bool:
+        """True if sign-in failed because the email/password pair is unknown"""
+        # AuthApiError carries a stable error code; older GoTrue servers only send the message
+        if getattr(error, "code", None) == "invalid_credentials":
+            return True
+        return "invalid login credentials" in str(error).lower()
 
 
 class ZoomPage(QWizardPage):
     """Connect Zoom account - Only admins can connect"""
     
+    # OAuth status polling: 1s, 1.5s, 2.25s, ... capped at 10s, for 3 minutes total
+    POLL_INITIAL_MS = 1000
+    POLL_MAX_MS = 10000
+    POLL_BUDGET_MS = 180_000
+    
     def __init__(self):
         super().__init__()
         self.setTitle("Connect Zoom")
@@ -348,30 +572,24 @@ class ZoomPage(QWizardPage):
         self.is_admin = False
         self.supabase_url = ""
         self.supabase_key = ""
+        self.admin_email = ""
+        self.admin_password = ""
         self.access_token = ""
+        self._polling = False
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setSingleShot(True)
+        self._poll_timer.timeout.connect(self._poll_status)
+        self.status_worker = None
+        self._auth_url = ""  # Prefetched Zoom authorization URL
         
         layout = QVBoxLayout()
         
         # Info for admins
-        self.admin_info = QLabel(
-            "Before connecting, make sure you have:\n\n"
-            "1. Created a Zoom OAuth App in Zoom Marketplace\n"
-            "2. Set the Redirect URI to:\n"
-            "   {your-supabase-url}/functions/v1/zoom-oauth\n"
-            "3. Added ZOOM_CLIENT_ID and ZOOM_CLIENT_SECRET\n"
-            "   to your Supabase Edge Function secrets"
-        )
-        self.admin_info.setWordWrap(True)
+        self.admin_info = StaticInfoLabel(ZOOM_ADMIN_TEXT)
         layout.addWidget(self.admin_info)
         
         # Warning for non-admins
-        self.non_admin_info = QLabel(
-            "Only administrators can connect Zoom.\n\n"
-            "Zoom is configured at the organization level.\n"
-            "Contact your administrator to set up Zoom integration."
-        )
-        self.non_admin_info.setWordWrap(True)
-        self.non_admin_info.setStyleSheet("color: #71717A; padding: 20px 0;")
+        self.non_admin_info = StaticInfoLabel(ZOOM_NON_ADMIN_TEXT, color="#71717A", padding=20)
         self.non_admin_info.setVisible(False)
         layout.addWidget(self.non_admin_info)
         
@@ -382,7 +600,7 @@ class ZoomPage(QWizardPage):
         btn_layout.addStretch()
         layout.addLayout(btn_layout)
         
-        self.status_lbl = QLabel("")
+        self.status_lbl = StatusLabel()
         layout.addWidget(self.status_lbl)
         
         self.skip_info = QLabel("You can skip this step and configure Zoom later.")
@@ -392,27 +610,67 @@ class ZoomPage(QWizardPage):
         self.setLayout(layout)
     
     def initializePage(self):
+        # Re-entering the page (Back, then Next) starts without a pending OAuth wait
+        self._stop_polling()
         self.supabase_url = self.field("supabase_url")
         self.supabase_key = self.field("supabase_key")
+        # Read once: used by the authorize fallback when there is no session
+        self.admin_email = self.field("admin_email")
+        self.admin_password = self.field("admin_password")
         
         # Get role from AdminPage (already authenticated)
         admin_page = self.wizard().page(2)  # AdminPage is page index 2
         self.is_admin = getattr(admin_page, 'user_role', 'user') == 'admin'
         
+        # Reuse the session from AdminPage (ZoomAuthorizeWorker signs in only without one)
+        session = self.wizard().session
+        if session:
+            self.access_token = session.access_token
+        self._auth_url = ""
+        
         # Disable button until status check completes
         self.connect_btn.setEnabled(False)
         self.connect_btn.setText("Checking...")
         
         # Only check Zoom status (role already known)
         self._check_zoom_status()
+        
+        # Admins: fetch the authorization URL alongside the status check so
+        # "Connect" can open the browser without another round-trip
+        if self.is_admin and self.access_token:
+            worker = ZoomAuthorizeWorker(
+                self.supabase_url, self.supabase_key, "", "", self.access_token
+            )
+            worker.signals.finished.connect(self._on_prefetch)
+            self.wizard().pool.start(worker)
+    
+    def cleanupPage(self):
+        self._stop_polling()
+        super().cleanupPage()
+    
+    def _on_prefetch(self, access_token, auth_url, error):
+        # Errors are ignored here: _connect_zoom requests the URL again
+        if auth_url and access_token == self.access_token:
+            self._auth_url = auth_url
     
     def _check_zoom_status(self):
         """Check if Zoom is connected"""
         self.status_lbl.setText("Checking Zoom status...")
         
-        self.worker = ZoomStatusWorker(self.supabase_url, self.supabase_key)
-        self.worker.finished.connect(self._on_zoom_status)
-        self.worker.start()
+        # One worker per (url, key), reused by the initial check and every poll
+        worker = self.status_worker
+        if worker is None or (worker.url, worker.key) != (self.supabase_url, self.supabase_key):
+            if worker is not None:
+                worker.signals.finished.disconnect()
+            worker = self.status_worker = ZoomStatusWorker(self.supabase_url, self.supabase_key)
+            worker.signals.finished.connect(self._on_status_result)
+        worker.trigger(self.wizard().pool)
+    
+    def _on_status_result(self, connected, msg):
+        if self._polling:
+            self._on_poll_result(connected, msg)
+        else:
+            self._on_zoom_status(connected, msg)
     
     def _on_zoom_status(self, connected, msg):
         self.zoom_connected = connected
@@ -442,84 +700,84 @@ class ZoomPage(QWizardPage):
         self.completeChanged.emit()
     
     def _connect_zoom(self):
-        try:
-            import httpx
-            
-            if not self.access_token:
-                email = self.field("admin_email")
-                password = self.field("admin_password")
-                
-                client = create_client(self.supabase_url, self.supabase_key)
-                
-                self.status_lbl.setText("Authenticating...")
-                auth_resp = client.auth.sign_in_with_password({
-                    "email": email,
-                    "password": password
-                })
-                
-                if not auth_resp.session:
-                    self.status_lbl.setText("Could not authenticate.")
-                    return
-                
-                self.access_token = auth_resp.session.access_token
-            
-            self.status_lbl.setText("Getting Zoom authorization URL...")
-            response = httpx.get(
-                f"{self.supabase_url}/functions/v1/zoom-oauth?action=authorize",
-                headers={
-                    "apikey": self.supabase_key,
-                    "Authorization": f"Bearer {self.access_token}"
-                },
-                timeout=10.0
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                auth_url = data.get("authorization_url")
-                
-                if auth_url:
-                    self.status_lbl.setText("Opening browser...")
-                    webbrowser.open(auth_url)
-                    
-                    self.connect_btn.setEnabled(False)
-                    self.connect_btn.setText("Waiting...")
-                    self._start_polling()
-                else:
-                    self.status_lbl.setText("No authorization URL received")
-            else:
-                error = response.json().get("error", "Unknown error")
-                self.status_lbl.setText(f"Error: {error}")
-                
-        except Exception as e:
-            self.status_lbl.setText(f"Error: {str(e)[:50]}")
+        if self._auth_url:
+            # Single use: a retry (e.g. after a timeout) fetches a fresh URL
+            auth_url, self._auth_url = self._auth_url, ""
+            self.connect_btn.setEnabled(False)
+            self._on_authorize(self.access_token, auth_url, "")
+            return
+        
+        # Sign-in and authorize request run on the pool; the UI stays responsive
+        self.connect_btn.setEnabled(False)
+        self.status_lbl.setText("Authenticating..." if not self.access_token else "Getting Zoom authorization URL...")
+        
+        worker = ZoomAuthorizeWorker(
+            self.supabase_url, self.supabase_key,
+            self.admin_email, self.admin_password,
+            self.access_token
+        )
+        worker.signals.finished.connect(self._on_authorize)
+        self.wizard().pool.start(worker)
+    
+    def _on_authorize(self, access_token, auth_url, error):
+        if access_token:
+            self.access_token = access_token
+        
+        if error:
+            self.status_lbl.setText(error)
+            self.connect_btn.setEnabled(True)
+            return
+        
+        self.status_lbl.setText("Opening browser...")
+        import webbrowser
+        webbrowser.open(auth_url)
+        
+        self.connect_btn.setText("Waiting...")
+        self._start_polling()
     
     def _start_polling(self):
-        self.poll_count = 0
-        self.poll_timer = QTimer()
-        self.poll_timer.timeout.connect(self._poll_status)
-        self.poll_timer.start(3000)
+        # Exponential backoff: quick checks while OAuth usually completes, then sparser
+        self._polling = True
+        self._poll_delay = self.POLL_INITIAL_MS
+        self._poll_elapsed = 0
+        self._schedule_poll()
     
-    def _poll_status(self):
-        self.poll_count += 1
-        if self.poll_count > 60:
-            self.poll_timer.stop()
+    def _schedule_poll(self):
+        if self._poll_elapsed >= self.POLL_BUDGET_MS:
+            self._polling = False
             self.connect_btn.setEnabled(True)
             self.connect_btn.setText("Connect Zoom Account")
             self.status_lbl.setText("Timed out. Try again.")
             return
         
-        self.worker = ZoomStatusWorker(self.supabase_url, self.supabase_key)
-        self.worker.finished.connect(self._on_poll_result)
-        self.worker.start()
+        self._poll_timer.start(self._poll_delay)
+        self._poll_elapsed += self._poll_delay
+        self._poll_delay = min(int(self._poll_delay * 1.5), self.POLL_MAX_MS)
+    
+    def _stop_polling(self):
+        self._polling = False
+        self._poll_timer.stop()
+    
+    def _poll_status(self):
+        if not self._polling:
+            return
+        
+        self.status_worker.trigger(self.wizard().pool)
     
     def _on_poll_result(self, connected, msg):
+        if not self._polling:
+            return
+        
         if connected:
-            self.poll_timer.stop()
+            self._polling = False
             self.status_lbl.setText("Zoom connected successfully!")
             self.zoom_connected = True
             self.connect_btn.setText("Connected")
             self.connect_btn.setEnabled(False)
             self.completeChanged.emit()
+        else:
+            # Next check only after this one answered (no overlapping requests)
+            self._schedule_poll()
 
 
 class CompletePage(QWizardPage):
@@ -564,6 +822,15 @@ class SetupWizard(QWizard):
         
         self.setWizardStyle(QWizard.WizardStyle.ModernStyle)
         
+        # Auth session captured by AdminPage, reused by later pages
+        self.session = None
+        self.user_id = None
+        
+        # Page workers run here: at most a connection/account check plus a
+        # Zoom status check at once, so two threads are enough
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        
         self.addPage(WelcomePage())
         self.addPage(SupabasePage())
         self.addPage(AdminPage())
@@ -576,4 +843,4 @@ class SetupWizard(QWizard):
     def _on_finished(self, result):
         if result == QWizard.DialogCode.Accepted:
             email = self.field("admin_email")
-            print(f"✓ Configuration saved for: {email}")
+            logger.info("Configuration saved for: %s", email)
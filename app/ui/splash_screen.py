@@ -3,54 +3,61 @@ Chronos - Splash Screen
 Displays while the app is loading.
 """
 
-from PyQt6.QtWidgets import QSplashScreen, QApplication
+from functools import lru_cache
+
+from PyQt6.QtWidgets import QSplashScreen
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap, QPainter, QColor, QFont
 
 
+@lru_cache(maxsize=1)
+def _build_splash_pixmap() -> QPixmap:
+    """Draw the splash content once (needs a QApplication; called on first use)"""
+    pixmap = QPixmap(400, 300)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    # Draw the splash content
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    
+    # Background
+    painter.setBrush(QColor("#FFFFFF"))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawRoundedRect(0, 0, 400, 300, 12, 12)
+    
+    # Border
+    painter.setPen(QColor("#E4E4E7"))
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    painter.drawRoundedRect(0, 0, 399, 299, 12, 12)
+    
+    # Title
+    painter.setPen(QColor("#09090B"))
+    font = QFont("IBM Plex Sans", 28, QFont.Weight.Bold)
+    painter.setFont(font)
+    painter.drawText(0, 100, 400, 50, Qt.AlignmentFlag.AlignCenter, "Chronos")
+    
+    # Subtitle
+    painter.setPen(QColor("#71717A"))
+    font = QFont("IBM Plex Sans", 12)
+    painter.setFont(font)
+    painter.drawText(0, 145, 400, 30, Qt.AlignmentFlag.AlignCenter, "Master your Time")
+    
+    # Loading text
+    painter.setPen(QColor("#A1A1AA"))
+    font = QFont("IBM Plex Sans", 10)
+    painter.setFont(font)
+    painter.drawText(0, 240, 400, 30, Qt.AlignmentFlag.AlignCenter, "Loading...")
+    
+    painter.end()
+    return pixmap
+
+
 class SplashScreen(QSplashScreen):
     """Modern splash screen for Chronos"""
     
     def __init__(self):
-        # Create a pixmap for the splash
-        pixmap = QPixmap(400, 300)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        
-        # Draw the splash content
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Background
-        painter.setBrush(QColor("#FFFFFF"))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(0, 0, 400, 300, 12, 12)
-        
-        # Border
-        painter.setPen(QColor("#E4E4E7"))
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawRoundedRect(0, 0, 399, 299, 12, 12)
-        
-        # Title
-        painter.setPen(QColor("#09090B"))
-        font = QFont("IBM Plex Sans", 28, QFont.Weight.Bold)
-        painter.setFont(font)
-        painter.drawText(0, 100, 400, 50, Qt.AlignmentFlag.AlignCenter, "Chronos")
-        
-        # Subtitle
-        painter.setPen(QColor("#71717A"))
-        font = QFont("IBM Plex Sans", 12)
-        painter.setFont(font)
-        painter.drawText(0, 145, 400, 30, Qt.AlignmentFlag.AlignCenter, "Master your Time")
-        
-        # Loading text
-        painter.setPen(QColor("#A1A1AA"))
-        font = QFont("IBM Plex Sans", 10)
-        painter.setFont(font)
-        painter.drawText(0, 240, 400, 30, Qt.AlignmentFlag.AlignCenter, "Loading...")
-        
-        painter.end()
-        
-        super().__init__(pixmap)
+        # The content is static: reuse the cached pixmap
+        super().__init__(_build_splash_pixmap())
         self.setWindowFlags(
             Qt.WindowType.SplashScreen | 
             Qt.WindowType.FramelessWindowHint |
@@ -58,10 +65,10 @@ class SplashScreen(QSplashScreen):
         )
     
     def update_message(self, message: str):
-        """Update the loading message"""
+        """Update the loading message (safe to connect to a worker's progress signal)"""
+        # showMessage() repaints the splash immediately; no event-loop flush needed
         self.showMessage(
             message,
             Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter,
             QColor("#71717A")
         )
-        QApplication.processEvents()
@@ -4,11 +4,13 @@ Background workers para operaciones asíncronas.
 """
 
 import os
+import asyncio
 import logging
+from datetime import datetime, timedelta
 from typing import List
 from concurrent.futures import ThreadPoolExecutor
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
 
 from app.models.schedule import Schedule
 from app.services.excel_service import (
@@ -18,17 +20,47 @@ from app.services.excel_service import (
 )
 from app.services.auth_service import auth_service
 from app.services.zoom_service import zoom_service
+from app.workers.pagination import fetch_all
 import utils
 
 
 logger = logging.getLogger(__name__)
 
+# Pool propio de los workers de una sola tarea: reutiliza hilos entre tareas
+# consecutivas (Excel -> Assignment -> Update) y deja núcleos libres, sin
+# tocar el pool global de Qt
+WORKER_POOL = QThreadPool()
+WORKER_POOL.setMaxThreadCount(max(2, QThread.idealThreadCount() - 2))
 
-class ExcelWorker(QThread):
-    """Worker thread para procesar archivos Excel sin bloquear la UI."""
-    
+MAX_CONCURRENT_UPDATES = 10  # Reasignaciones simultáneas contra la API de Zoom
+UPDATE_BATCH_SIZE = 50  # Reasignaciones guardadas en BD por lote
+
+
+class _WorkerSignals(QObject):
+    """Señales de los workers del pool (QRunnable no es QObject)."""
     progress = pyqtSignal(str)
-    finished = pyqtSignal(list, list)  # schedules, errors
+    finished = pyqtSignal(list, list)
+
+
+class _PooledWorker(QRunnable):
+    """
+    Base de los workers de una sola tarea.
+    
+    Se inician con WORKER_POOL.start(worker); progress y finished se exponen
+    en el worker para conectarlos como antes.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = _WorkerSignals()
+        self.progress = self.signals.progress
+        self.finished = self.signals.finished
+
+
+class ExcelWorker(_PooledWorker):
+    """Worker para procesar archivos Excel sin bloquear la UI."""
+    
+    # finished: schedules, errors
 
     def __init__(self, file_paths: List[str]):
         super().__init__()
@@ -56,11 +88,10 @@ class ExcelWorker(QThread):
         self.finished.emit(all_schedules, errors)
 
 
-class AssignmentWorker(QThread):
-    """Worker thread para procesar la asignación automática de reuniones."""
+class AssignmentWorker(_PooledWorker):
+    """Worker para procesar la asignación automática de reuniones."""
     
-    progress = pyqtSignal(str)
-    finished = pyqtSignal(list, list)  # results, errors
+    # finished: results, errors
 
     def __init__(self, schedules: List[Schedule]):
         super().__init__()
@@ -75,87 +106,47 @@ class AssignmentWorker(QThread):
             self.progress.emit("Connecting to Supabase...")
             supabase = auth_service.get_client()
             
-            # 1. Fetch Zoom Users
-            self.progress.emit("Fetching Zoom Users...")
-            users_response = supabase.table("zoom_users").select(
-                "id, first_name, last_name, display_name, email"
-            ).execute()
-            
-            users_by_id = {}
-            users_by_name = {}
-            
-            for u in users_response.data:
-                uid = u["id"]
-                dname = u.get("display_name")
-                fname = u.get("first_name", "").strip()
-                lname = u.get("last_name", "").strip()
-                full_name = f"{fname} {lname}".strip()
-                
-                if not dname:
-                    dname = full_name
-                
-                u["display_name"] = dname
-                u["full_name"] = full_name
-                
-                users_by_id[uid] = u
-                
-                c_dname = utils.canonical(dname)
-                if c_dname:
-                    users_by_name[c_dname] = u
-                    
-                c_fullname = utils.canonical(full_name)
-                if c_fullname and c_fullname != c_dname:
-                    users_by_name[c_fullname] = u
-            
-            # 2. Fetch Zoom Meetings
-            self.progress.emit("Fetching Zoom Meetings...")
-            zoom_meetings = []
-            page_size = 1000
-            offset = 0
-            
-            while True:
-                response = supabase.table("zoom_meetings")\
-                    .select("meeting_id, topic, host_id")\
-                    .range(offset, offset + page_size - 1)\
-                    .execute()
-                if not response.data:
-                    break
-                zoom_meetings.extend(response.data)
-                if len(response.data) < page_size:
-                    break
-                offset += page_size
-                self.progress.emit(f"Fetching Zoom Meetings... ({len(zoom_meetings)} loaded)")
+            # 1-2. Fetch Zoom Users y Meetings en paralelo: las páginas de
+            # reuniones se descargan mientras se indexan los usuarios
+            self.progress.emit("Fetching Zoom Users and Meetings...")
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                meetings_future = executor.submit(
+                    fetch_all, supabase, "zoom_meetings", "meeting_id, topic, host_id", "meeting_id",
+                    on_progress=lambda n: self.progress.emit(f"Fetching Zoom Meetings... ({n} loaded)")
+                )
+                users, users_by_name = self._load_users(supabase)
+                zoom_meetings = meetings_future.result()
                 
             self.progress.emit(f"Processing {len(self.schedules)} schedules against {len(zoom_meetings)} meetings...")
             
-            # Build meetings map
-            meetings_map = {"by_topic": {}, "list": []}
-        
-            for m in zoom_meetings:
-                try:
-                    host_data = users_by_id.get(m.get("host_id"))
-                    m["host_name"] = host_data.get("display_name", "Unknown") if host_data else "Unknown"
-                    
-                    topic = m.get("topic", "")
-                    c_topic = utils.canonical(topic)
-                    
-                    meetings_map["list"].append(m)
-                    if c_topic:
-                        meetings_map["by_topic"][c_topic] = m
-                except Exception:
-                    continue
-
-            # 3. Pre-compute choices for fuzzy matching
-            instructor_choices = {}
-            for u in users_by_id.values():
-                instructor_choices[utils.normalizar_cadena(u["display_name"])] = u
-                if u.get("full_name"):
-                    instructor_choices[utils.normalizar_cadena(u["full_name"])] = u
-            
-            meeting_choices = {utils.normalizar_cadena(m["topic"]): m for m in meetings_map["list"]}
+            # 3. Build meetings map (exact, canonical key) from the topic column
+            topics = [m.get("topic", "") for m in zoom_meetings]
+            meetings_map = {"by_topic": {
+                c_topic: m
+                for c_topic, m in zip(map(utils.canonical, topics), zoom_meetings)
+                if c_topic
+            }}
 
             # 4. Process Schedules
-            for i, schedule in enumerate(self.schedules):
+            # Claves canónicas calculadas una sola vez antes del bucle
+            normalized_schedules = [
+                (utils.canonical(s.instructor), utils.canonical(s.program), s)
+                for s in self.schedules
+            ]
+            
+            # Fuzzy matching en lote solo para las filas sin coincidencia exacta;
+            # las opciones normalizadas se arman solo si alguna fila las necesita
+            self.progress.emit("Matching instructors and meetings...")
+            instr_misses = [None if c_instr in users_by_name else s.instructor for c_instr, _, s in normalized_schedules]
+            prog_misses = [None if c_prog in meetings_map["by_topic"] else s.program for _, c_prog, s in normalized_schedules]
+            
+            instructor_choices = self._instructor_choices(users) if any(instr_misses) else {}
+            meeting_choices = dict(zip(map(utils.normalizar_cadena, topics), zoom_meetings)) if any(prog_misses) else {}
+            
+            fuzzy_instructors = utils.fuzzy_find_many(instr_misses, instructor_choices)
+            fuzzy_meetings = utils.fuzzy_find_many(prog_misses, meeting_choices, threshold=75)
+            
+            for i, (c_instr, c_prog, schedule) in enumerate(normalized_schedules):
                 if i % 10 == 0:
                     self.progress.emit(f"Analyzing {i+1}/{len(self.schedules)}...")
                 
@@ -163,24 +154,11 @@ class AssignmentWorker(QThread):
                 match_reason = "No match found"
                 meeting_id = ""
                 
-                raw_instr = schedule.instructor
-                raw_prog = schedule.program
-                
-                c_instr = utils.canonical(raw_instr)
-                c_prog = utils.canonical(raw_prog)
-                
-                found_meeting = None
-                found_instructor = None
-                
                 # Search instructor
-                found_instructor = users_by_name.get(c_instr)
-                if not found_instructor:
-                    found_instructor = utils.fuzzy_find(raw_instr, instructor_choices)
+                found_instructor = users_by_name.get(c_instr) or fuzzy_instructors[i]
 
                 # Search meeting
-                found_meeting = meetings_map["by_topic"].get(c_prog)
-                if not found_meeting:
-                    found_meeting = utils.fuzzy_find(raw_prog, meeting_choices, threshold=75)
+                found_meeting = meetings_map["by_topic"].get(c_prog) or fuzzy_meetings[i]
                 
                 # Determine status
                 if found_meeting and found_instructor:
@@ -207,12 +185,19 @@ class AssignmentWorker(QThread):
                     status = "not_found"
                     match_reason = "Neither Meeting nor Instructor found"
 
+                # Texto de la columna Time y link, listos para la UI
+                start_24h = schedule._convert_to_24h(schedule.start_time)
+                end_24h = schedule._convert_to_24h(schedule.end_time)
+                has_link = bool(meeting_id) and str(meeting_id) != "-"
+                
                 results.append({
                     "schedule": schedule,
                     "status": status,
                     "meeting_id": meeting_id,
                     "reason": match_reason,
-                    "found_instructor": found_instructor
+                    "found_instructor": found_instructor,
+                    "time_str": f"{start_24h} - {end_24h}",
+                    "meeting_url": f"https://zoom.us/meeting/{meeting_id}" if has_link else None
                 })
                 
         except Exception as e:
@@ -221,12 +206,56 @@ class AssignmentWorker(QThread):
             
         self.finished.emit(results, errors)
 
+    def _load_users(self, supabase):
+        """
+        Descarga los usuarios de Zoom y los indexa por nombre canónico.
+        
+        Returns:
+            (usuarios con display_name/full_name resueltos, users_by_name por clave canónica)
+        """
+        users_response = supabase.table("zoom_users").select(
+            "id, first_name, last_name, display_name, email"
+        ).execute()
+        
+        users_by_name = {}
+        
+        for u in users_response.data:
+            dname = u.get("display_name")
+            fname = u.get("first_name", "").strip()
+            lname = u.get("last_name", "").strip()
+            full_name = f"{fname} {lname}".strip()
+            
+            if not dname:
+                dname = full_name
+            
+            u["display_name"] = dname
+            u["full_name"] = full_name
+            
+            c_dname = utils.canonical(dname)
+            if c_dname:
+                users_by_name[c_dname] = u
+                
+            c_fullname = utils.canonical(full_name)
+            if c_fullname and c_fullname != c_dname:
+                users_by_name[c_fullname] = u
+        
+        return users_response.data, users_by_name
+    
+    @staticmethod
+    def _instructor_choices(users: List[dict]) -> dict:
+        """Opciones para fuzzy matching de instructores (claves normalizadas)."""
+        instructor_choices = {}
+        for u in users:
+            instructor_choices[utils.normalizar_cadena(u["display_name"])] = u
+            if u.get("full_name"):
+                instructor_choices[utils.normalizar_cadena(u["full_name"])] = u
+        return instructor_choices
+
 
-class UpdateWorker(QThread):
-    """Worker thread para ejecutar la reasignación en Zoom y BD."""
+class UpdateWorker(_PooledWorker):
+    """Worker para ejecutar la reasignación en Zoom y BD."""
     
-    progress = pyqtSignal(str)
-    finished = pyqtSignal(list, list)  # success_list, error_list
+    # finished: success_list, error_list
 
     def __init__(self, assignments: List[dict], update_recurrence: bool = False):
         super().__init__()
@@ -252,7 +281,6 @@ class UpdateWorker(QThread):
             current_token = token_data["access_token"]
             
             # Check if token is expired and refresh
-            from datetime import datetime
             expires_at = token_data.get("expires_at")
             if expires_at:
                 try:
@@ -265,9 +293,8 @@ class UpdateWorker(QThread):
             
             # Recurrence settings (if updating recurrence)
             recurrence_settings = None
-            start_time_str = None
+            start_times = {}  # start_time de la fila ("HH:MM") -> start_time para Zoom
             if self.update_recurrence:
-                from datetime import datetime, timedelta
                 # Base settings - will override start_time per item
                 end_date = datetime.now() + timedelta(days=120)
                 end_date_str = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -277,81 +304,138 @@ class UpdateWorker(QThread):
                     "weekly_days": "2,3,4,5,6",  # Mon-Fri
                     "end_date_time": end_date_str
                 }
+                
+                # Fechas de inicio calculadas una vez por hora distinta, antes
+                # de repartir el trabajo entre los hilos
+                base_start = datetime.now() + timedelta(days=1)
+                for item in self.assignments:
+                    row_start_time = item.get("start_time", "09:00")  # Default 9:00 AM
+                    if row_start_time in start_times:
+                        continue
+                    # Parse row start_time (HH:MM format)
+                    try:
+                        hour, minute = map(int, row_start_time.split(":"))
+                    except Exception:
+                        hour, minute = 9, 0
+                    start_date = base_start.replace(hour=hour, minute=minute, second=0, microsecond=0)
+                    start_times[row_start_time] = start_date.strftime("%Y-%m-%dT%H:%M:%S")
             
-            # 2. Process assignments
-            total = len(self.assignments)
-            update_recurrence = self.update_recurrence
+            # 2. Process assignments (un event loop propio en este hilo del pool)
+            results = asyncio.run(
+                self._drive(supabase, current_token, recurrence_settings, start_times)
+            )
+            for result in results:
+                if result["success"]:
+                    successes.append(result)
+                else:
+                    errors.append(result)
+                        
+        except Exception as e:
+            logger.exception("Error in UpdateWorker")
+            errors.append({"success": False, "error": str(e)})
             
-            def process_assignment(item, token):
+        self.finished.emit(successes, errors)
+
+    async def _drive(self, supabase, token, recurrence_settings, start_times) -> List[dict]:
+        """
+        Reasigna todas las reuniones con un solo AsyncClient (HTTP/2 si h2
+        está instalado) y a lo sumo MAX_CONCURRENT_UPDATES en vuelo. El nuevo
+        host se guarda en BD en lotes de UPDATE_BATCH_SIZE.
+        
+        Returns:
+            Un resultado por asignación, en el mismo orden
+        """
+        total = len(self.assignments)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPDATES)
+        results = [None] * total
+        # Reasignaciones hechas en Zoom aún no guardadas: (fila, índice en results)
+        pending = []
+        done = 0
+        
+        async with zoom_service.async_client() as client:
+            async def process_assignment(index, item):
                 """Process single assignment."""
+                nonlocal done
                 meeting_id = item["meeting_id"]
                 new_host_email = item["new_host_email"]
                 new_host_id = item["new_host_id"]
                 topic = item.get("topic", "")
                 row_start_time = item.get("start_time", "09:00")  # Default 9:00 AM
                 
-                try:
-                    # Update host
-                    zoom_service.update_meeting_host(token, meeting_id, new_host_email)
-                    
-                    # Update recurrence if enabled
-                    if update_recurrence and recurrence_settings:
-                        from datetime import datetime, timedelta
-                        # Parse row start_time (HH:MM format)
-                        try:
-                            hour, minute = map(int, row_start_time.split(":"))
-                        except:
-                            hour, minute = 9, 0
+                async with semaphore:
+                    try:
+                        # Update host
+                        await zoom_service.update_meeting_host_async(
+                            client, token, meeting_id, new_host_email
+                        )
                         
-                        start_date = datetime.now() + timedelta(days=1)
-                        start_date = start_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                        item_start_time_str = start_date.strftime("%Y-%m-%dT%H:%M:%S")
+                        # Update recurrence if enabled
+                        if recurrence_settings:
+                            await zoom_service.update_meeting_async(
+                                client,
+                                access_token=token,
+                                meeting_id=meeting_id,
+                                topic=topic,
+                                start_time=start_times[row_start_time],
+                                duration=60,
+                                recurrence=recurrence_settings
+                            )
                         
-                        zoom_service.update_meeting(
-                            access_token=token,
-                            meeting_id=meeting_id,
-                            topic=topic,
-                            start_time=item_start_time_str,
-                            duration=60,
-                            recurrence=recurrence_settings
-                        )
-                    
-                    # Update DB
-                    supabase.table("zoom_meetings").update({
-                        "host_id": new_host_id
-                    }).eq("meeting_id", meeting_id).execute()
-                    
-                    return {"success": True, "topic": topic, "meeting_id": meeting_id}
-                except Exception as e:
-                    return {"success": False, "topic": topic, "error": str(e)}
-            
-            # Process with ThreadPoolExecutor
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                futures = []
-                for item in self.assignments:
-                    future = executor.submit(process_assignment, item, current_token)
-                    futures.append(future)
+                        results[index] = {"success": True, "topic": topic, "meeting_id": meeting_id}
+                        pending.append(({"meeting_id": meeting_id, "host_id": new_host_id}, index))
+                    except Exception as e:
+                        results[index] = {"success": False, "topic": topic, "error": str(e)}
                 
-                for i, future in enumerate(futures):
-                    self.progress.emit(f"Updating {i+1}/{total}...")
-                    result = future.result()
-                    if result["success"]:
-                        successes.append(result)
-                    else:
-                        errors.append(result)
-                        
-        except Exception as e:
-            logger.exception("Error in UpdateWorker")
-            errors.append({"success": False, "error": str(e)})
+                done += 1
+                self.progress.emit(f"Updating {done}/{total}...")
+                
+                if len(pending) >= UPDATE_BATCH_SIZE:
+                    batch = pending[:]
+                    pending.clear()
+                    # Cliente síncrono: fuera del event loop
+                    await asyncio.to_thread(self._flush_host_updates, supabase, batch, results)
             
-        self.finished.emit(successes, errors)
+            await asyncio.gather(*[
+                process_assignment(index, item) for index, item in enumerate(self.assignments)
+            ])
+        
+        if pending:
+            await asyncio.to_thread(self._flush_host_updates, supabase, pending, results)
+        return results
 
+    @staticmethod
+    def _flush_host_updates(supabase, batch, results):
+        """
+        Guarda en BD el nuevo host de un lote de reuniones: un update por host
+        con todas sus reuniones (update, no upsert: no crea filas que falten).
+        
+        Si el update de un host falla se reintenta fila por fila, para
+        atribuir el error a su reunión (el resultado pasa a error).
+        """
+        by_host = {}
+        for row, index in batch:
+            by_host.setdefault(row["host_id"], []).append((row["meeting_id"], index))
+        
+        for host_id, members in by_host.items():
+            try:
+                supabase.table("zoom_meetings").update({
+                    "host_id": host_id
+                }).in_("meeting_id", [meeting_id for meeting_id, _ in members]).execute()
+            except Exception as batch_err:
+                logger.warning(f"Batch update failed, retrying per row: {batch_err}")
+                for meeting_id, index in members:
+                    try:
+                        supabase.table("zoom_meetings").update({
+                            "host_id": host_id
+                        }).eq("meeting_id", meeting_id).execute()
+                    except Exception as e:
+                        results[index] = {"success": False, "topic": results[index]["topic"], "error": str(e)}
 
-class MeetingSearchWorker(QThread):
-    """Worker thread para buscar reuniones en Supabase."""
+
+class MeetingSearchWorker(_PooledWorker):
+    """Worker para buscar reuniones en Supabase."""
     
-    progress = pyqtSignal(str)
-    finished = pyqtSignal(list, list)  # meetings, errors
+    # finished: meetings, errors
 
     def run(self):
         logger.debug("MeetingSearchWorker started")
@@ -364,26 +448,11 @@ class MeetingSearchWorker(QThread):
             
             self.progress.emit("Fetching meetings...")
             
-            # Paginated fetch
-            page_size = 1000
-            offset = 0
-            
-            while True:
-                response = supabase.table("zoom_meetings")\
-                    .select("meeting_id, topic, host_id, created_at")\
-                    .range(offset, offset + page_size - 1)\
-                    .execute()
-                    
-                if not response.data:
-                    break
-                    
-                meetings.extend(response.data)
-                
-                if len(response.data) < page_size:
-                    break
-                    
-                offset += page_size
-                self.progress.emit(f"Loading meetings... ({len(meetings)})")
+            # Paginated fetch (páginas en paralelo)
+            meetings = fetch_all(
+                supabase, "zoom_meetings", "meeting_id, topic, host_id, created_at", "meeting_id",
+                on_progress=lambda n: self.progress.emit(f"Loading meetings... ({n})")
+            )
             
             # Fetch users for host names
             self.progress.emit("Fetching user data...")
@@ -410,6 +479,7 @@ class MeetingSearchWorker(QThread):
 from app.workers.link_creation import LinkCreationWorker
 
 __all__ = [
+    "WORKER_POOL",
     "ExcelWorker",
     "AssignmentWorker", 
     "UpdateWorker",
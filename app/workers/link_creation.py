@@ -4,67 +4,110 @@ Worker for creating Zoom links for a list of programs.
 """
 
 import logging
+import queue
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from typing import List, Optional, Tuple
 
 from PyQt6.QtCore import QThread, pyqtSignal
+from rapidfuzz import process, fuzz
 
 from app.services.auth_service import auth_service
 from app.services.zoom_service import zoom_service
+from app.workers.pagination import fetch_all
 import utils
 
 logger = logging.getLogger(__name__)
 
+# Una línea no vacía del texto pegado (acepta finales \n, \r\n y \r)
+_LINE_RE = re.compile(r'[^\n\r]+')
+
+# Reuniones creadas que se guardan en BD con un solo upsert
+UPSERT_BATCH_SIZE = 50
+
+
+def _parse_programs(text: str) -> Tuple[List[str], int]:
+    """
+    Extrae los programas del texto pegado: una línea por programa, sin vacías.
+    
+    Los duplicados (ignorando mayúsculas y espacios repetidos) se descartan
+    conservando la primera aparición tal como se pegó.
+    
+    Returns:
+        (programas únicos, cantidad de duplicados descartados)
+    """
+    unique = {}
+    total = 0
+    for m in _LINE_RE.finditer(text):
+        program = m.group(0).strip()
+        if program:
+            total += 1
+            unique.setdefault(" ".join(program.split()).casefold(), program)
+    return list(unique.values()), total - len(unique)
+
 
 class LinkCreationWorker(QThread):
     """Worker thread para crear/actualizar links de Zoom."""
     
     progress = pyqtSignal(str)
-    finished = pyqtSignal(list, list, str)  # results, errors, mode
+    # results, errors, mode, items de la tarea, duplicados descartados (verify)
+    finished = pyqtSignal(list, list, str, object, int)
 
-    def __init__(self, items: List[Dict], mode: str = "verify"):
+    def __init__(self, parent=None):
         """
+        Hilo persistente: se inicia una vez y procesa las tareas encoladas con
+        submit() en orden, emitiendo finished al terminar cada una.
+        """
+        super().__init__(parent)
+        self._queue = queue.Queue()
+
+    def submit(self, items, mode: str = "verify"):
+        """
+        Encola una tarea.
+        
         Args:
-            items: List of dicts with {program, status, meeting_id} for create mode,
-                   or just list of program strings for verify mode
+            items: List of dicts with {program, status, meeting_id} for create mode;
+                   raw pasted text (one program per line) or a list of program
+                   strings for verify mode
             mode: "verify" or "create"
         """
-        super().__init__()
-        self.items = items
-        self.mode = mode
+        self._queue.put((items, mode))
+
+    def stop(self):
+        """Termina el hilo después de la tarea en curso (si la hay)."""
+        self._queue.put(None)
 
     def run(self):
-        logger.debug(f"LinkCreationWorker started in {self.mode} mode")
+        while True:
+            task = self._queue.get()
+            if task is None:
+                break
+            self._run_task(*task)
+
+    def _run_task(self, items, mode: str):
+        logger.debug(f"LinkCreationWorker started in {mode} mode")
         results = []
         errors = []
+        duplicates_removed = 0
         
         try:
             self.progress.emit("Connecting to database...")
             supabase = auth_service.get_client()
             
             # === VERIFY MODE ===
-            if self.mode == "verify":
-                programs = [item.strip() if isinstance(item, str) else item.get("program", "").strip() 
-                           for item in self.items]
-                programs = [p for p in programs if p]
+            if mode == "verify":
+                # El texto pegado se parsea aquí para no bloquear el hilo de UI
+                if isinstance(items, str):
+                    programs, duplicates_removed = _parse_programs(items)
+                else:
+                    programs = [item.strip() if isinstance(item, str) else item.get("program", "").strip() 
+                               for item in items]
+                    programs = [p for p in programs if p]
                 
                 # Fetch existing meetings
                 self.progress.emit("Checking existing meetings...")
-                existing_meetings = []
-                page_size = 1000
-                offset = 0
-                
-                while True:
-                    response = supabase.table("zoom_meetings")\
-                        .select("meeting_id, topic, join_url")\
-                        .range(offset, offset + page_size - 1)\
-                        .execute()
-                    if not response.data:
-                        break
-                    existing_meetings.extend(response.data)
-                    if len(response.data) < page_size:
-                        break
-                    offset += page_size
+                existing_meetings = fetch_all(supabase, "zoom_meetings", "meeting_id, topic, join_url", "meeting_id")
                 
                 # Create a map for fuzzy lookup
                 meeting_choices = {
@@ -72,21 +115,27 @@ class LinkCreationWorker(QThread):
                     for m in existing_meetings 
                     if m.get("topic")
                 }
+                choice_keys = list(meeting_choices.keys())
                 
                 # Process each program
                 total = len(programs)
-                for i, program in enumerate(programs):
+                normalized_programs = list(map(utils.normalizar_cadena, programs))
+                for i, (program, normalized_prog) in enumerate(zip(programs, normalized_programs)):
                     self.progress.emit(f"Processing {i+1}/{total}: {program}")
                     
-                    normalized_prog = utils.normalizar_cadena(program)
-                    
                     # Check if exists
                     found_meeting = None
                     if normalized_prog in meeting_choices:
                         found_meeting = meeting_choices[normalized_prog]
                         match_type = "Exact match"
                     else:
-                        found_meeting = utils.fuzzy_find(program, meeting_choices, threshold=85)
+                        # Mismo scorer que utils.fuzzy_find, sin renormalizar ni relistar las claves
+                        match = process.extractOne(
+                            normalized_prog, choice_keys,
+                            scorer=fuzz.token_set_ratio, score_cutoff=85
+                        )
+                        if match:
+                            found_meeting = meeting_choices[match[0]]
                         match_type = "Fuzzy match"
                     
                     if found_meeting:
@@ -142,90 +191,159 @@ class LinkCreationWorker(QThread):
                 }
                 
                 # Process items
-                total = len(self.items)
-                for i, item in enumerate(self.items):
-                    program = item.get("program", "")
-                    status = item.get("status", "")
-                    meeting_id = item.get("meeting_id", "")
-                    
-                    self.progress.emit(f"Processing {i+1}/{total}: {program}")
-                    
-                    # Skip items that are not actionable
-                    if status not in ["ready", "to_update"]:
-                        results.append(item)  # Keep original
-                        continue
-                    
-                    try:
-                        if status == "ready":
-                            # CREATE new meeting
-                            meeting = zoom_service.create_meeting(
-                                access_token=current_token,
-                                user_id="me",
-                                topic=program,
-                                start_time=start_time_str,
-                                duration=60,
-                                recurrence=recurrence
-                            )
-                            
-                            # Save to DB
-                            meeting_data = {
-                                "meeting_id": str(meeting["id"]),
-                                "uuid": meeting.get("uuid"),
-                                "host_id": meeting.get("host_id"),
-                                "topic": meeting.get("topic"),
-                                "type": meeting.get("type"),
-                                "duration": meeting.get("duration"),
-                                "timezone": meeting.get("timezone"),
-                                "join_url": meeting.get("join_url"),
-                                "created_at": meeting.get("created_at")
-                            }
-                            supabase.table("zoom_meetings").upsert(meeting_data).execute()
-                            
-                            results.append({
-                                "program": program,
-                                "status": "created",
-                                "meeting_id": str(meeting["id"]),
-                                "join_url": meeting.get("join_url"),
-                                "message": "Created successfully"
-                            })
-                            
-                        elif status == "to_update":
-                            # UPDATE existing meeting
-                            zoom_service.update_meeting(
-                                access_token=current_token,
-                                meeting_id=meeting_id,
-                                topic=program,
-                                start_time=start_time_str,
-                                duration=60,
-                                recurrence=recurrence
-                            )
-                            
-                            # Update topic in DB
-                            supabase.table("zoom_meetings").update({
-                                "topic": program
-                            }).eq("meeting_id", meeting_id).execute()
-                            
-                            results.append({
-                                "program": program,
-                                "status": "updated",
-                                "meeting_id": meeting_id,
-                                "join_url": item.get("join_url", ""),
-                                "message": "Updated successfully"
-                            })
-                            
-                    except Exception as e:
-                        logger.error(f"Error processing {program}: {e}")
-                        results.append({
-                            "program": program,
-                            "status": "error",
-                            "meeting_id": meeting_id or "-",
-                            "join_url": item.get("join_url", "-"),
-                            "message": str(e)
-                        })
-                        errors.append(f"{program}: {str(e)}")
+                # Reuniones creadas aún no guardadas: (meeting_data, índice en results, item)
+                pending_upserts = []
+                try:
+                    self._create_items(
+                        items, supabase, current_token, start_time_str, recurrence,
+                        results, errors, pending_upserts
+                    )
+                finally:
+                    # Las reuniones ya existen en Zoom: guardarlas aunque el bucle se corte
+                    self._flush_upserts(supabase, pending_upserts, results, errors)
             
         except Exception as e:
             logger.exception("Error in LinkCreationWorker")
             errors.append(str(e))
             
-        self.finished.emit(results, errors, self.mode)
+        self.finished.emit(results, errors, mode, items, duplicates_removed)
+
+    def _create_items(self, items, supabase, current_token, start_time_str, recurrence,
+                      results, errors, pending_upserts):
+        """Crea/actualiza en Zoom los items accionables (modo create), varios a la vez."""
+        total = len(items)
+        
+        def process_item(item):
+            """
+            Procesa un item accionable (corre en el pool).
+            
+            Returns:
+                (resultado, meeting_data a guardar en BD o None, error o None)
+            """
+            program = item.get("program", "")
+            status = item.get("status", "")
+            meeting_id = item.get("meeting_id", "")
+            
+            try:
+                if status == "ready":
+                    # CREATE new meeting
+                    meeting = zoom_service.create_meeting(
+                        access_token=current_token,
+                        user_id="me",
+                        topic=program,
+                        start_time=start_time_str,
+                        duration=60,
+                        recurrence=recurrence
+                    )
+                    
+                    # Save to DB (en lote, ver _flush_upserts)
+                    meeting_data = {
+                        "meeting_id": str(meeting["id"]),
+                        "uuid": meeting.get("uuid"),
+                        "host_id": meeting.get("host_id"),
+                        "topic": meeting.get("topic"),
+                        "type": meeting.get("type"),
+                        "duration": meeting.get("duration"),
+                        "timezone": meeting.get("timezone"),
+                        "join_url": meeting.get("join_url"),
+                        "created_at": meeting.get("created_at")
+                    }
+                    return {
+                        "program": program,
+                        "status": "created",
+                        "meeting_id": str(meeting["id"]),
+                        "join_url": meeting.get("join_url"),
+                        "message": "Created successfully"
+                    }, meeting_data, None
+                
+                # UPDATE existing meeting
+                zoom_service.update_meeting(
+                    access_token=current_token,
+                    meeting_id=meeting_id,
+                    topic=program,
+                    start_time=start_time_str,
+                    duration=60,
+                    recurrence=recurrence
+                )
+                
+                # Update topic in DB
+                supabase.table("zoom_meetings").update({
+                    "topic": program
+                }).eq("meeting_id", meeting_id).execute()
+                
+                return {
+                    "program": program,
+                    "status": "updated",
+                    "meeting_id": meeting_id,
+                    "join_url": item.get("join_url", ""),
+                    "message": "Updated successfully"
+                }, None, None
+                
+            except Exception as e:
+                logger.error(f"Error processing {program}: {e}")
+                return {
+                    "program": program,
+                    "status": "error",
+                    "meeting_id": meeting_id or "-",
+                    "join_url": item.get("join_url", "-"),
+                    "message": str(e)
+                }, None, f"{program}: {str(e)}"
+        
+        # Llamadas a Zoom en paralelo (como UpdateWorker); los resultados se
+        # recogen en orden y los upserts se agrupan en este hilo
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(process_item, item)
+                if item.get("status", "") in ("ready", "to_update") else None
+                for item in items
+            ]
+            
+            for i, (item, future) in enumerate(zip(items, futures)):
+                self.progress.emit(f"Processing {i+1}/{total}: {item.get('program', '')}")
+                
+                # Skip items that are not actionable
+                if future is None:
+                    results.append(item)  # Keep original
+                    continue
+                
+                result, meeting_data, error = future.result()
+                results.append(result)
+                if error:
+                    errors.append(error)
+                if meeting_data:
+                    pending_upserts.append((meeting_data, len(results) - 1, item))
+                    if len(pending_upserts) >= UPSERT_BATCH_SIZE:
+                        self._flush_upserts(supabase, pending_upserts, results, errors)
+
+    def _flush_upserts(self, supabase, pending_upserts, results, errors):
+        """
+        Guarda en BD las reuniones creadas pendientes con un solo upsert.
+        
+        Si el lote falla se reintenta fila por fila para atribuir el error
+        a su programa (el resultado pasa a "error", como antes).
+        """
+        if not pending_upserts:
+            return
+        
+        try:
+            supabase.table("zoom_meetings").upsert(
+                [meeting_data for meeting_data, _, _ in pending_upserts]
+            ).execute()
+        except Exception as batch_err:
+            logger.warning(f"Batch upsert failed, retrying per row: {batch_err}")
+            for meeting_data, index, item in pending_upserts:
+                try:
+                    supabase.table("zoom_meetings").upsert(meeting_data).execute()
+                except Exception as e:
+                    program = results[index]["program"]
+                    logger.error(f"Error processing {program}: {e}")
+                    results[index] = {
+                        "program": program,
+                        "status": "error",
+                        "meeting_id": item.get("meeting_id", "") or "-",
+                        "join_url": item.get("join_url", "-"),
+                        "message": str(e)
+                    }
+                    errors.append(f"{program}: {str(e)}")
+        
+        pending_upserts.clear()
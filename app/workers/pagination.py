@@ -0,0 +1,93 @@
+"""
+Chronos - Paginación de Supabase
+Descarga tablas completas pidiendo las páginas en paralelo.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+
+PAGE_SIZE = 1000
+MAX_CONCURRENT_PAGES = 8  # Límite de peticiones simultáneas a Supabase
+
+
+def fetch_all(
+    supabase: 'Client',
+    table: str,
+    columns: str,
+    key: str,
+    page_size: int = PAGE_SIZE,
+    on_progress: Optional[Callable[[int], None]] = None
+) -> List[dict]:
+    """
+    Descarga todas las filas de una tabla, ordenadas por una columna única.
+
+    La primera página trae también el total (count="exact"); con él, las
+    páginas restantes se piden en paralelo y se concatenan en orden. El
+    orden por `key` hace que las páginas no se solapen ni dejen huecos.
+    Si el servidor no devuelve el total, se pagina en serie por keyset
+    (key > última clave), con costo constante por página.
+
+    Args:
+        supabase: Cliente de Supabase
+        table: Nombre de la tabla
+        columns: Columnas para select() (deben incluir `key`)
+        key: Columna única e indexada para ordenar (p. ej. "meeting_id")
+        page_size: Filas por página
+        on_progress: Callback con la cantidad de filas cargadas tras cada página
+
+    Returns:
+        Lista con todas las filas
+    """
+    def fetch_page(offset: int) -> List[dict]:
+        response = supabase.table(table)\
+            .select(columns)\
+            .order(key)\
+            .range(offset, offset + page_size - 1)\
+            .execute()
+        return response.data or []
+
+    def fetch_after(last_key) -> List[dict]:
+        response = supabase.table(table)\
+            .select(columns)\
+            .order(key)\
+            .gt(key, last_key)\
+            .limit(page_size)\
+            .execute()
+        return response.data or []
+
+    first = supabase.table(table)\
+        .select(columns, count="exact")\
+        .order(key)\
+        .limit(page_size)\
+        .execute()
+    rows = list(first.data or [])
+    if len(rows) < page_size:
+        return rows
+
+    if on_progress:
+        on_progress(len(rows))
+
+    if first.count is None:
+        # Sin conteo: keyset en serie hasta una página incompleta
+        page = rows
+        while len(page) == page_size:
+            page = fetch_after(page[-1][key])
+            rows.extend(page)
+            if page and on_progress:
+                on_progress(len(rows))
+        return rows
+
+    offsets = range(page_size, first.count, page_size)
+    if offsets:
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_PAGES, len(offsets))) as executor:
+            # map() entrega las páginas en orden de offset
+            for page in executor.map(fetch_page, offsets):
+                rows.extend(page)
+                if on_progress:
+                    on_progress(len(rows))
+
+    return rows
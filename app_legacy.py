@@ -42,7 +42,7 @@ from theme_manager import theme
 from ui_components import SearchBar, FilterChip, ToastNotification, CustomButton
 
 # Workers (modularizados en app/workers/)
-from app.workers import ExcelWorker, AssignmentWorker, UpdateWorker, MeetingSearchWorker
+from app.workers import WORKER_POOL, ExcelWorker, AssignmentWorker, UpdateWorker, MeetingSearchWorker
 
 # UI Delegates (modularizados en app/ui/)
 from app.ui.delegates import RowHoverDelegate, CheckBoxHeader
@@ -984,8 +984,7 @@ class SchedulePlanner(QMainWindow):
 
     def on_cell_entered(self, row, column):
         """Maneja el evento de hover en las celdas."""
-        self.hover_delegate.hover_row = row
-        self.table.viewport().update()
+        self.hover_delegate.set_hover_row(row)
 
     def leaveEvent(self, event):
         """Resetea el hover cuando el mouse sale de la ventana (opcional, mejor en la tabla)."""
@@ -1178,7 +1177,7 @@ class SchedulePlanner(QMainWindow):
             self.worker = ExcelWorker(file_paths)
             self.worker.progress.connect(self.on_progress)
             self.worker.finished.connect(self.on_files_loaded)
-            self.worker.start()
+            WORKER_POOL.start(self.worker)
 
     def on_progress(self, message: str):
         """Actualiza el progreso."""
@@ -2,8 +2,9 @@ import re
 import os
 import sys
 import unicodedata
+from functools import lru_cache
 from rapidfuzz import process, fuzz
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -87,6 +88,8 @@ def remove_irrelevant(text: str) -> str:
     return " ".join(filtered_tokens)
 
 
+# Schedules repeat the same instructor/program names: cache the normalized keys
+@lru_cache(maxsize=65536)
 def canonical(s: str) -> str:
     s = remove_irrelevant(s or "")
     s = unicodedata.normalize("NFKD", s)
@@ -95,6 +98,7 @@ def canonical(s: str) -> str:
     return s.casefold()
 
 
+@lru_cache(maxsize=65536)
 def normalizar_cadena(s: str) -> str:
     s = remove_irrelevant(s or "")
     s = unicodedata.normalize("NFKD", s)
@@ -125,3 +129,25 @@ def fuzzy_find(
         return choices[best_match_key]
 
     return None
+
+
+def fuzzy_find_many(
+    raws: List[Optional[str]], choices: Dict[str, Any], scorer=fuzz.token_set_ratio, threshold: int = 85
+) -> List[Any]:
+    """fuzzy_find for many queries: choice keys listed once, each distinct query scored once"""
+    if not choices:
+        return [None] * len(raws)
+
+    keys = list(choices.keys())
+    matches: Dict[str, Any] = {}  # raw -> match
+    by_query: Dict[str, Any] = {}  # normalized query -> match (raws differing in case/accents/digits)
+
+    for raw in raws:
+        if raw and raw not in matches:
+            query = normalizar_cadena(raw)
+            if query not in by_query:
+                result = process.extractOne(query, keys, scorer=scorer, score_cutoff=threshold)
+                by_query[query] = choices[result[0]] if result else None
+            matches[raw] = by_query[query]
+
+    return [matches[raw] if raw else None for raw in raws]